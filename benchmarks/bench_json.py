@@ -0,0 +1,99 @@
+"""
+Serialization benchmark for a /query response of 50 IDs x 200 conditions.
+
+Compares the previous path (one {"condition", "value"} dict per cell,
+serialized by Flask's default provider) with the ExpressionList rows
+serialized by FastJSONProvider, on both its stdlib and orjson backends.
+
+Run from the project root:
+    python -m benchmarks.bench_json
+"""
+import timeit
+import numpy as np
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from src.gene.services.expression_helpers import build_expression_rows
+from src.gene.utils.json_provider import FastJSONProvider, orjson
+
+N_IDS = 50
+N_CONDITIONS = 200
+REPEAT = 200
+
+
+def dict_records(columns, block):
+    return [
+        {
+            "id_gen": f"Phvul.{i:03d}G000100",
+            "id_transcript": f"Phvul.{i:03d}G000100.t1",
+            "expression": [
+                {"condition": col, "value": value}
+                for col, value in zip(columns, row)
+            ],
+        }
+        for i, row in enumerate(block.tolist())
+    ]
+
+
+def list_records(columns, block):
+    return [
+        {
+            "id_gen": f"Phvul.{i:03d}G000100",
+            "id_transcript": f"Phvul.{i:03d}G000100.t1",
+            "expression": expression,
+        }
+        for i, expression in enumerate(build_expression_rows(columns, block))
+    ]
+
+
+def envelope(data):
+    return {
+        "status": "success",
+        "code": "MULTI_EXPR_FOUND",
+        "message": f"Expression data retrieved for {len(data)} record(s).",
+        "data": data,
+    }
+
+
+def jsonify(provider, data):
+    # Same body as the routes' jsonify(...) with the given provider
+    return provider.response(envelope(data)).get_data()
+
+
+def main():
+    rng = np.random.default_rng(0)
+    columns = [f"SRR{1000000 + i}" for i in range(N_CONDITIONS)]
+    block = rng.gamma(2.0, 50.0, size=(N_IDS, N_CONDITIONS))
+
+    app = Flask(__name__)
+    default = DefaultJSONProvider(app)
+    fast_stdlib = FastJSONProvider(app)
+    fast_stdlib.use_orjson = False
+    fast_orjson = FastJSONProvider(app)
+
+    cases = [
+        ("dict per cell + default provider",
+         lambda: jsonify(default, dict_records(columns, block))),
+        ("ExpressionList + FastJSONProvider (stdlib)",
+         lambda: jsonify(fast_stdlib, list_records(columns, block))),
+    ]
+    if orjson is not None:
+        cases.append(
+            ("ExpressionList + FastJSONProvider (orjson)",
+             lambda: jsonify(fast_orjson, list_records(columns, block)))
+        )
+
+    expected = cases[0][1]()
+    baseline = None
+    print(f"{N_IDS} IDs x {N_CONDITIONS} conditions, "
+          f"{len(expected) / 1024:.0f} KiB per response\n")
+
+    for name, run in cases:
+        assert run() == expected, f"{name}: output differs"
+        seconds = min(timeit.repeat(run, number=REPEAT, repeat=3)) / REPEAT
+        baseline = baseline or seconds
+        print(f"{name:<45} {seconds * 1000:7.2f} ms  "
+              f"x{baseline / seconds:.1f}")
+
+
+if __name__ == "__main__":
+    main()
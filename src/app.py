@@ -1,11 +1,30 @@
 from flask import Flask
 from flask_cors import CORS
 from src.gene.routes.routes import expression_bp 
+from src.gene.cli import expdb_cli
+from src.gene.repository.warmup import start_warm_up
+from src.gene.utils.json_provider import FastJSONProvider
+from src.gene.utils.compression import compress_response
 from src.config import Config
+from src.gene.constants import DATASET_VERSION_HEADER
 
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
-    CORS(app, resources={r"/*": {"origins": "*"}})
+    app.json = FastJSONProvider(app)
+    app.json.use_orjson = (
+        app.json.use_orjson and Config.EXPDB_JSON_BACKEND != "stdlib"
+    )
+    CORS(
+        app,
+        resources={r"/*": {"origins": "*"}},
+        expose_headers=[DATASET_VERSION_HEADER],
+    )
     app.register_blueprint(expression_bp , url_prefix="/expression")
+    app.after_request(compress_response)
+    app.cli.add_command(expdb_cli)
+    start_warm_up(
+        mode=Config.EXPDB_WARMUP,
+        max_workers=Config.EXPDB_WARMUP_WORKERS,
+    )
     return app
@@ -12,3 +12,86 @@ class Config:
             os.path.join(os.path.dirname(__file__), "..", "expdb")
         )
     )
+
+    # Maximum number of parsed datasets kept in memory per process.
+    # Least recently used datasets are evicted first.
+    DATASET_CACHE_SIZE = int(os.getenv("DATASET_CACHE_SIZE", "16"))
+
+    # Seconds a request waits for a dataset another request is already
+    # loading before giving up with a read error.
+    DATASET_LOAD_TIMEOUT = float(os.getenv("DATASET_LOAD_TIMEOUT", "120"))
+
+    # Write and read binary sidecars (.values.npy / .ids.npz) next to each
+    # expression CSV version, so cache misses skip CSV parsing.
+    EXPDB_BINARY_CACHE = os.getenv(
+        "EXPDB_BINARY_CACHE", "true"
+    ).lower() in {"1", "true", "yes"}
+
+    # How expression matrices are held by each worker:
+    #   memory - parsed into process memory (default)
+    #   mmap   - memory-mapped from the .values.npy sidecar, so all workers
+    #            on a host share the same page-cache pages
+    EXPDB_STORAGE = os.getenv("EXPDB_STORAGE", "memory").lower()
+
+    # Dataset warm-up at startup: off | sync | background.
+    # Use "sync" with `gunicorn --preload` so workers inherit warm datasets.
+    EXPDB_WARMUP = os.getenv("EXPDB_WARMUP", "off").lower()
+
+    # Number of datasets loaded in parallel during warm-up
+    EXPDB_WARMUP_WORKERS = int(os.getenv("EXPDB_WARMUP_WORKERS", "4"))
+
+    # Seconds a scanned organism folder is trusted before its mtime is
+    # checked again for new dataset versions (0 checks on every request).
+    EXPDB_CATALOG_TTL = float(os.getenv("EXPDB_CATALOG_TTL", "5"))
+
+    # Load new dataset versions in the background and swap them in, while
+    # the version already in memory keeps serving requests.
+    EXPDB_HOT_SWAP = os.getenv(
+        "EXPDB_HOT_SWAP", "true"
+    ).lower() in {"1", "true", "yes"}
+
+    # JSON encoder for responses: auto (orjson when installed) | stdlib.
+    # Both write the same bytes.
+    EXPDB_JSON_BACKEND = os.getenv("EXPDB_JSON_BACKEND", "auto").lower()
+
+    # Cache-Control sent with the metadata and single-gene responses, which
+    # also carry an ETag and Last-Modified of their dataset version.
+    # The default lets browsers and CDNs store them but revalidate first.
+    EXPDB_CACHE_CONTROL = os.getenv("EXPDB_CACHE_CONTROL", "public, no-cache")
+
+    # Bytes of serialized single-gene and /query responses kept per process
+    # for repeated requests (0 disables the response cache).
+    EXPDB_RESPONSE_CACHE_BYTES = int(
+        os.getenv("EXPDB_RESPONSE_CACHE_BYTES", str(64 * 1024 * 1024))
+    )
+
+    # Compress JSON responses (gzip; br / zstd when brotli / zstandard are
+    # installed) for clients that accept it, from this size in bytes.
+    EXPDB_COMPRESSION = os.getenv(
+        "EXPDB_COMPRESSION", "true"
+    ).lower() in {"1", "true", "yes"}
+    EXPDB_COMPRESSION_MIN_SIZE = int(
+        os.getenv("EXPDB_COMPRESSION_MIN_SIZE", "1024")
+    )
+
+    # Build a sorted index per condition column on first use by /filter,
+    # so selective range predicates read only the matching rows.
+    EXPDB_FILTER_INDEXES = os.getenv(
+        "EXPDB_FILTER_INDEXES", "true"
+    ).lower() in {"1", "true", "yes"}
+
+    # Compute per-condition and per-row summary statistics in the
+    # background after each dataset version loads (otherwise on the first
+    # /stats request).
+    EXPDB_SUMMARY_STATS = os.getenv(
+        "EXPDB_SUMMARY_STATS", "true"
+    ).lower() in {"1", "true", "yes"}
+
+    # Threads per worker running the targets of a /batch/query request
+    EXPDB_BATCH_WORKERS = int(os.getenv("EXPDB_BATCH_WORKERS", "4"))
+
+    # Arrays derived from each dataset version and kept for reuse: /filter
+    # column indexes (~12 bytes per row each), co-expression row norms
+    # (8 bytes per row per column set) and the Spearman rank matrix
+    # (rows x conditions x 8 bytes). Least recently used ones are dropped.
+    EXPDB_DERIVED_ENTRIES = int(os.getenv("EXPDB_DERIVED_ENTRIES", "32"))
@@ -31,3 +31,53 @@ INVALID_COLUMNS = "INVALID_COLUMNS"
 
 # Errors
 INVALID_JSON = "INVALID_JSON"
+
+# --------------------
+# EXPORT API Response Codes
+# --------------------
+# Success
+EXPORT_PAGE_FOUND = "EXPORT_PAGE_FOUND"
+EXPORT_PAGE_EMPTY = "EXPORT_PAGE_EMPTY"
+
+# Errors
+INVALID_CURSOR = "INVALID_CURSOR"
+
+# --------------------
+# READINESS API Response Codes
+# --------------------
+READY = "READY"
+NOT_READY = "NOT_READY"
+
+# --------------------
+# RESPONSE FORMAT Codes
+# --------------------
+# Errors
+UNSUPPORTED_FORMAT = "UNSUPPORTED_FORMAT"
+
+# --------------------
+# CO-EXPRESSION API Response Codes
+# --------------------
+# Success
+COEXPR_FOUND = "COEXPR_FOUND"
+COEXPR_NOT_FOUND = "COEXPR_NOT_FOUND"
+
+# --------------------
+# VALUE FILTER API Response Codes
+# --------------------
+# Success
+FILTER_FOUND = "FILTER_FOUND"
+FILTER_NOT_FOUND = "FILTER_NOT_FOUND"
+
+# --------------------
+# SUMMARY STATISTICS API Response Codes
+# --------------------
+# Success
+STATS_FOUND = "STATS_FOUND"
+STATS_NOT_FOUND = "STATS_NOT_FOUND"
+
+# --------------------
+# AUTOCOMPLETE API Response Codes
+# --------------------
+# Success
+AUTOCOMPLETE_FOUND = "AUTOCOMPLETE_FOUND"
+AUTOCOMPLETE_NOT_FOUND = "AUTOCOMPLETE_NOT_FOUND"
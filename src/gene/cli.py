@@ -0,0 +1,27 @@
+import click
+from flask.cli import AppGroup
+from src.gene.repository.csv_repository import build_binary_cache
+from src.gene.utils.resolve_file import iter_dataset_files
+
+expdb_cli = AppGroup("expdb", help="Manage the expression database.")
+
+
+@expdb_cli.command("convert")
+@click.option("--organism", default=None, help="Only convert this organism.")
+@click.option("--force", is_flag=True, help="Rewrite fresh sidecars too.")
+def convert(organism: str | None, force: bool):
+    """
+    Write binary sidecars for every expression CSV version.
+    """
+    datasets = [
+        d for d in iter_dataset_files(organism)
+        if d[1] != "meta"
+    ]
+
+    for _, _, _, _, path in datasets:
+        try:
+            written = build_binary_cache(path, force=force)
+        except Exception as exc:
+            click.echo(f"FAILED   {path}: {exc}", err=True)
+            continue
+        click.echo(f"{'WROTE' if written else 'FRESH'}    {path}")
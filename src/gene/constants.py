@@ -17,3 +17,22 @@ REQUIRED_META_COLUMNS = [
     "reference",
     "doi",
 ]
+
+# --------------------
+# RESPONSE HEADERS
+# --------------------
+
+# Dataset version file(s) a response was built from
+DATASET_VERSION_HEADER = "X-Dataset-Version"
+
+# --------------------
+# RESPONSE FORMATS
+# --------------------
+
+# Expression response format -> media type (see utils/response_formats.py)
+EXPRESSION_FORMATS = {
+    "records": "application/json",
+    "columnar": "application/vnd.expdb.columnar+json",
+    "float32": "application/vnd.expdb.float32",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
@@ -1,11 +1,35 @@
+import hashlib
+import logging
+import os
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable
 import pandas as pd
+from src.config import Config
+from src.gene.repository.dataset_cache import DatasetCache
+from src.gene.repository.expression_dataset import ExpressionDataset
+from src.gene.repository.meta_dataset import MetaDataset
+from src.gene.repository.summary_stats import precompute_summary_stats
 from src.gene.utils.resolve_file import resolve_dataset_file
-from src.gene.utils.read_file import read_dataset
+from src.gene.utils.read_file import (
+    read_dataset,
+    read_dataset_header,
+    read_expression_dataset,
+)
+from src.gene.utils.binary_cache import (
+    is_binary_cache_fresh,
+    read_binary_dataset,
+    read_binary_header,
+    source_stamp,
+    write_binary_dataset,
+)
 from src.gene.constants import (
     REQUIRED_GENE_COLUMNS,
     REQUIRED_META_COLUMNS,
 )
 
+logger = logging.getLogger(__name__)
+
 # --------------------
 # EXCEPTIONS
 # --------------------
@@ -13,20 +37,117 @@ class DatasetSchemaError(Exception):
     pass
 
 
+# --------------------
+# CACHE
+# --------------------
+_dataset_cache = DatasetCache(
+    max_entries=Config.DATASET_CACHE_SIZE,
+    load_timeout=Config.DATASET_LOAD_TIMEOUT,
+)
+
+# Column names per dataset version; tiny, so many more are kept
+_header_cache = DatasetCache(
+    max_entries=256,
+    load_timeout=Config.DATASET_LOAD_TIMEOUT,
+)
+
+# Dataset versions served in the current request (see served_versions)
+_served_versions: ContextVar[list[str] | None] = ContextVar(
+    "served_versions", default=None
+)
+_served_tokens: ContextVar[list[tuple[tuple, str]] | None] = ContextVar(
+    "served_tokens", default=None
+)
+
+
 # --------------------
 # FUNCTIONS
 # --------------------
+def load_expression_dataset(
+    organism: str,
+    data_type: str,
+    feature: str,
+    columns: list[str] | None = None,
+) -> ExpressionDataset:
+    """
+    Load an expression dataset (raw / scorez) with its ID indexes.
+
+    If `columns` is given, the returned dataset is only guaranteed to hold
+    those condition columns. When the full matrix is not already resident
+    and a fresh binary sidecar exists, the column-major sidecar is
+    memory-mapped, so pages of other columns are never touched. Without a
+    sidecar the whole file is parsed once and cached as the full dataset,
+    since a CSV has to be scanned in full whatever the columns.
+    """
+    key, path, version = _resolve(organism, data_type, feature)
+
+    if columns is None or Config.EXPDB_STORAGE == "mmap":
+        return _fetch(key, version, lambda: _read_expression(path))
+
+    # A resident full dataset serves any column set; with hot swap it keeps
+    # serving while the newer version loads in the background
+    resident = _dataset_cache.resident_version(key)
+    if resident == version or (Config.EXPDB_HOT_SWAP and resident is not None):
+        return _fetch(key, version, lambda: _read_expression(path))
+
+    if Config.EXPDB_BINARY_CACHE and is_binary_cache_fresh(path):
+        return _fetch(
+            (*key, "mapped"),
+            version,
+            lambda: ExpressionDataset(*read_binary_dataset(path, mmap=True)),
+        )
+
+    return _fetch(key, version, lambda: _read_expression(path))
+
+
+def load_expression_header(
+    organism: str,
+    data_type: str,
+    feature: str,
+) -> list[str]:
+    """
+    Return the column names of an expression dataset without loading its
+    values. Headers are cached per dataset version.
+    """
+    key, path, version = _resolve(organism, data_type, feature)
+
+    def read_header() -> list[str]:
+        dataset = _dataset_cache.peek(key, version)
+        if dataset is not None:
+            return dataset.columns.tolist()
+        if Config.EXPDB_BINARY_CACHE and is_binary_cache_fresh(path):
+            try:
+                return [*REQUIRED_GENE_COLUMNS, *read_binary_header(path)]
+            except IOError:
+                pass
+        header = read_dataset_header(path)
+        if not set(REQUIRED_GENE_COLUMNS).issubset(header):
+            raise DatasetSchemaError("Dataset schema is invalid.")
+        return header
+
+    return _header_cache.get_or_load(key, version, read_header)
+
+
 def load_expression_df(
     organism: str,
     data_type: str,
     feature: str,
 ) -> pd.DataFrame:
     """
-    Load an expression dataset (raw / scorez).
+    Load an expression dataset (raw / scorez) as a DataFrame.
+    Condition columns are float64.
     """
-    df = _load_df(organism, data_type, feature)
-    _validate_columns(df, REQUIRED_GENE_COLUMNS)
-    return df
+    return load_expression_dataset(organism, data_type, feature).to_frame()
+
+
+def load_meta_dataset(
+    organism: str,
+    feature: str,
+) -> MetaDataset:
+    """
+    Load a metadata dataset with its serialized records and field indexes.
+    """
+    return _load(organism, "meta", feature, _read_meta)
 
 
 def load_meta_df(
@@ -36,26 +157,278 @@ def load_meta_df(
     """
     Load a metadata dataset.
     """
-    df = _load_df(organism, "meta", feature)
-    _validate_columns(df, REQUIRED_META_COLUMNS)
-    return df
+    return load_meta_dataset(organism, feature).frame
+
+
+def dataset_version_info(
+    organism: str,
+    data_type: str,
+    feature: str,
+) -> tuple[str, datetime]:
+    """
+    Version token and file modification time of the dataset version a
+    request would be served from, without loading it.
+
+    With hot swap, while an older version is in memory that one is
+    reported, and the load of the newer one is started in the background
+    just as a full request would, so clients that only revalidate still
+    move to the new version once it is swapped in.
+    The version is recorded as served for the current request.
+    """
+    key, path, version = _resolve(organism, data_type, feature)
+    resident = _dataset_cache.resident_version(key)
+    if Config.EXPDB_HOT_SWAP and resident not in (None, version):
+        if data_type.lower() == "meta":
+            loader = lambda: _read_meta(path)
+        else:
+            loader = lambda: _read_expression(path)
+        _fetch(key, version, loader)
+        version = resident
+    _record_served(key, version)
+    modified = datetime.fromtimestamp(version[1] / 1e9, tz=timezone.utc)
+    return _version_token(version), modified
+
+
+def build_binary_cache(path: str, force: bool = False) -> bool:
+    """
+    Write the binary sidecar of an expression CSV.
+    Returns False when a fresh sidecar already exists and `force` is not set.
+    """
+    if not force and is_binary_cache_fresh(path):
+        return False
+    stamp = source_stamp(path)
+    dataset = _parse_expression_csv(path)
+    _write_binary_cache(path, dataset, stamp)
+    return True
+
+
+def served_versions() -> list[str]:
+    """
+    Names of the dataset version files (without `.csv`) served so far in
+    the current request context, in load order.
+    """
+    return list(_served_versions.get() or [])
+
+
+def served_version_tokens(dataset: tuple[str, str, str]) -> list[str]:
+    """
+    Version tokens (as in `ExpressionDataset.version`) of a dataset
+    (organism, data_type, feature) served so far in the current request
+    context, in load order.
+    """
+    return [
+        token
+        for key, token in _served_tokens.get() or []
+        if key == dataset
+    ]
+
+
+def reset_served_versions():
+    """
+    Start recording served dataset versions for a new request.
+    """
+    _served_versions.set([])
+    _served_tokens.set([])
+
+
+def served_version_state() -> tuple[list[str], list[tuple[tuple, str]]]:
+    """
+    Snapshot of the versions recorded in the current context, to carry
+    them from a worker thread back to the request (see
+    `record_served_state`); context variables are not shared by threads.
+    """
+    return served_versions(), list(_served_tokens.get() or [])
+
+
+def record_served_state(state: tuple[list[str], list[tuple[tuple, str]]]):
+    """
+    Record the versions of a `served_version_state` snapshot as served in
+    the current context, after the ones already recorded.
+    """
+    names, tokens = state
+    for var, values in ((_served_versions, names), (_served_tokens, tokens)):
+        served = var.get()
+        if served is None:
+            served = []
+            var.set(served)
+        served.extend(v for v in values if v not in served)
+
+
+def cache_stats() -> dict:
+    """
+    Return hit / miss / eviction counters of the dataset cache, including
+    how many loads were coalesced onto one already in flight.
+    """
+    return _dataset_cache.stats()
+
+
+def clear_cache():
+    """
+    Drop every cached dataset.
+    """
+    _dataset_cache.clear()
 
 
 # --------------------
 # INTERNAL HELPERS
 # --------------------
 
-def _load_df(
+def _resolve(
     organism: str,
     data_type: str,
     feature: str,
-) -> pd.DataFrame:
+) -> tuple[tuple[str, str, str], str, tuple[str, int, int]]:
+    # Cache key, resolved latest version file and its version stamp
     path = resolve_dataset_file(
         organism=organism,
         data_type=data_type,
         feature=feature,
     )
-    return read_dataset(path)
+    key = (organism.lower(), data_type.lower(), feature.lower())
+    return key, path, (path, *_file_stamp(path))
+
+
+def _load(
+    organism: str,
+    data_type: str,
+    feature: str,
+    build: Callable[[str], Any],
+) -> Any:
+    key, path, version = _resolve(organism, data_type, feature)
+    return _fetch(key, version, lambda: build(path))
+
+
+def _fetch(
+    key: tuple,
+    version: tuple[str, int, int],
+    loader: Callable[[], Any],
+) -> Any:
+    # With hot swap, a newer version loads in the background while the
+    # resident one keeps being served
+    def load() -> Any:
+        value = loader()
+        if isinstance(value, (ExpressionDataset, MetaDataset)):
+            value.version = _version_token(version)
+        # Full datasets get their summary statistics built once per version
+        if (
+            isinstance(value, ExpressionDataset)
+            and len(key) == 3
+            and Config.EXPDB_SUMMARY_STATS
+        ):
+            precompute_summary_stats(value)
+        return value
+
+    if Config.EXPDB_HOT_SWAP:
+        served, value = _dataset_cache.get_or_swap(key, version, load)
+    else:
+        served, value = version, _dataset_cache.get_or_load(
+            key, version, load
+        )
+    _record_served(key[:3], served)
+    return value
+
+
+def _version_token(version: tuple[str, int, int]) -> str:
+    # Short opaque digest of (path, mtime, size)
+    return hashlib.sha1(repr(version).encode()).hexdigest()[:16]
+
+
+def _record_served(key: tuple, version: tuple[str, int, int]):
+    name = os.path.basename(version[0])
+    if name.endswith(".csv"):
+        name = name[:-len(".csv")]
+    for var, value in (
+        (_served_versions, name),
+        (_served_tokens, (key, _version_token(version))),
+    ):
+        served = var.get()
+        if served is None:
+            served = []
+            var.set(served)
+        if value not in served:
+            served.append(value)
+
+
+def _read_expression(path: str) -> ExpressionDataset:
+    # Prefer the binary sidecar; parse the CSV (and write one) otherwise
+    mmap = Config.EXPDB_STORAGE == "mmap"
+    use_sidecar = Config.EXPDB_BINARY_CACHE or mmap
+
+    if use_sidecar and is_binary_cache_fresh(path):
+        try:
+            return ExpressionDataset(*read_binary_dataset(path, mmap=mmap))
+        except IOError:
+            logger.warning(
+                "Ignoring unreadable binary cache for %s", path, exc_info=True
+            )
+
+    # Stamped before parsing, so a CSV rewritten meanwhile is not
+    # recorded as the source of the older data
+    stamp = source_stamp(path)
+    dataset = _parse_expression_csv(path)
+
+    if use_sidecar:
+        try:
+            _write_binary_cache(path, dataset, stamp)
+        except OSError:
+            logger.warning(
+                "Could not write binary cache for %s", path, exc_info=True
+            )
+            return dataset
+
+        if mmap:
+            # Re-open from the sidecar so the parsed copy can be released
+            # and this worker shares the mapped pages with the others
+            try:
+                return ExpressionDataset(*read_binary_dataset(path, mmap=True))
+            except IOError:
+                logger.warning(
+                    "Could not map binary cache for %s", path, exc_info=True
+                )
+
+    return dataset
+
+
+def _parse_expression_csv(path: str) -> ExpressionDataset:
+    df = read_expression_dataset(path, REQUIRED_GENE_COLUMNS)
+    _validate_columns(df, REQUIRED_GENE_COLUMNS)
+    return ExpressionDataset.from_frame(df)
+
+
+def _write_binary_cache(
+    path: str,
+    dataset: ExpressionDataset,
+    stamp: tuple[int, int],
+):
+    write_binary_dataset(
+        path,
+        id_gen=dataset.id_gen,
+        id_transcript=dataset.id_transcript,
+        conditions=dataset.conditions,
+        values=dataset.values,
+        stamp=stamp,
+    )
+
+
+def _read_meta(path: str) -> MetaDataset:
+    return MetaDataset(_read_validated(path, REQUIRED_META_COLUMNS))
+
+
+def _read_validated(path: str, required: list[str]) -> pd.DataFrame:
+    df = read_dataset(path)
+    _validate_columns(df, required)
+    return df
+
+
+def _file_stamp(path: str) -> tuple[int, int]:
+    # (mtime, size) identifies a version file rewritten in place
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            "The requested dataset file does not exist."
+        )
+    return stat.st_mtime_ns, stat.st_size
 
 
 def _validate_columns(df: pd.DataFrame, required: list[str]):
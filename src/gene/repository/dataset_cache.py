@@ -0,0 +1,241 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetCache:
+    """
+    Process-wide LRU cache of loaded datasets.
+
+    Entries are keyed by dataset identity (organism, data_type, feature)
+    and remember the version they were loaded from: the resolved file path
+    plus its (mtime, size) stamp. A lookup with a different version drops
+    the stale entry and loads again, so publishing a new `_vN.csv` or
+    rewriting a file in place is picked up on the next request.
+
+    `get_or_swap` instead keeps serving the stale entry while the new
+    version loads in a background thread, then swaps it in atomically.
+    Requests already holding the old value finish on it, and its memory is
+    released once the last of them drops its reference.
+
+    Loads are single-flight per key: while one caller loads a version,
+    concurrent callers for the same key and version wait for its result
+    (up to `load_timeout` seconds) instead of starting their own parse.
+    """
+
+    def __init__(self, max_entries: int, load_timeout: float | None = None):
+        self.max_entries = max(1, max_entries)
+        self.load_timeout = load_timeout
+        self._entries: OrderedDict[Hashable, tuple[Any, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, _InFlight] = {}
+        self._failed: dict[Hashable, Any] = {}  # key -> version that failed
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "load_timeouts": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "stale_hits": 0,
+            "swaps": 0,
+            "swap_failures": 0,
+        }
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        version: Any,
+        loader: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached value for `key` at `version`, calling `loader`
+        on a miss or when the cached entry belongs to another version.
+        exceptions:
+            TimeoutError: If waiting on another caller's load timed out.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == version:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1]
+                del self._entries[key]
+                self._stats["invalidations"] += 1
+
+            flight = self._in_flight.get(key)
+            leader = flight is None or flight.version != version
+            if leader:
+                self._stats["misses"] += 1
+                flight = self._start_flight(key, version)
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            return self._wait(flight)
+
+        # Parse outside the lock so other datasets keep being served
+        return self._run_flight(key, flight, loader)
+
+    def get_or_swap(
+        self,
+        key: Hashable,
+        version: Any,
+        loader: Callable[[], Any],
+    ) -> tuple[Any, Any]:
+        """
+        Like `get_or_load`, but when `key` is cached at another version the
+        cached value is returned right away and `version` is loaded in the
+        background. Returns (served_version, value).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry[0] == version:
+                    self._stats["hits"] += 1
+                    return entry
+                self._stats["stale_hits"] += 1
+                self._schedule_reload(key, version, loader)
+                return entry
+
+        return version, self.get_or_load(key, version, loader)
+
+    def peek(self, key: Hashable, version: Any) -> Any | None:
+        """
+        Return the cached value for `key` at `version` without loading,
+        touching LRU order or counting a hit/miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        return None
+
+    def resident_version(self, key: Hashable) -> Any | None:
+        """
+        Version of the entry cached for `key` (None if not cached), which
+        is the version `get_or_swap` serves while a newer one loads.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "in_flight": len(self._in_flight),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # --------------------
+    # INTERNAL HELPERS
+    # --------------------
+
+    def _store(self, key: Hashable, version: Any, value: Any):
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _start_flight(self, key: Hashable, version: Any) -> "_InFlight":
+        # Called with the lock held
+        flight = _InFlight(version)
+        self._in_flight[key] = flight
+        return flight
+
+    def _run_flight(
+        self,
+        key: Hashable,
+        flight: "_InFlight",
+        loader: Callable[[], Any],
+    ) -> Any:
+        try:
+            flight.value = loader()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        else:
+            self._store(key, flight.version, flight.value)
+            return flight.value
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+            flight.done.set()
+
+    def _wait(self, flight: "_InFlight") -> Any:
+        if not flight.done.wait(self.load_timeout):
+            with self._lock:
+                self._stats["load_timeouts"] += 1
+            raise TimeoutError(
+                "Timed out waiting for the dataset to be loaded."
+            )
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _schedule_reload(
+        self,
+        key: Hashable,
+        version: Any,
+        loader: Callable[[], Any],
+    ):
+        # Called with the lock held; one load per key and version at a
+        # time, and a version that failed is not retried until the file
+        # changes again
+        flight = self._in_flight.get(key)
+        if flight is not None and flight.version == version:
+            return
+        if self._failed.get(key) == version:
+            return
+        flight = self._start_flight(key, version)
+        threading.Thread(
+            target=self._reload,
+            args=(key, flight, loader),
+            name=f"dataset-reload-{key}",
+            daemon=True,
+        ).start()
+
+    def _reload(
+        self,
+        key: Hashable,
+        flight: "_InFlight",
+        loader: Callable[[], Any],
+    ):
+        try:
+            self._run_flight(key, flight, loader)
+        except Exception:
+            logger.exception("Background reload of %s failed", key)
+            with self._lock:
+                self._failed[key] = flight.version
+                self._stats["swap_failures"] += 1
+            return
+
+        with self._lock:
+            self._failed.pop(key, None)
+            self._stats["swaps"] += 1
+
+
+class _InFlight:
+    """
+    A load in progress, shared by every caller waiting for it.
+    """
+
+    def __init__(self, version: Any):
+        self.version = version
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
@@ -0,0 +1,171 @@
+from typing import Any, Callable, Hashable
+import numpy as np
+import pandas as pd
+from src.config import Config
+from src.gene.repository.dataset_cache import DatasetCache
+from src.gene.utils.numeric import to_float_array, to_float_series
+
+_EMPTY_ROWS = np.empty(0, dtype=np.intp)
+_ID_COLUMNS = ("id_gen", "id_transcript")
+
+# Values pinned for the whole version (see `pinned`); a fixed few keys
+_PINNED_ENTRIES = 8
+
+
+class ExpressionDataset:
+    """
+    A loaded expression dataset together with its lookup indexes.
+
+    ID columns are kept as string arrays and every condition column is
+    stored in one column-major float64 matrix (rows x conditions), coerced
+    once at load time with `safe_float` semantics. float64 is kept on purpose: float32
+    would change the values served to existing clients.
+
+    Indexes are built once when the dataset is loaded and map each
+    gene / transcript ID to the row positions holding it, so lookups are
+    dictionary accesses instead of full-column scans.
+
+    Data derived from the values (see `derived`) is cached on the dataset
+    itself, so it lives at most as long as this version is served. Values
+    that must not be recomputed for the version (see `pinned`) are kept
+    apart from that LRU.
+    """
+
+    def __init__(
+        self,
+        id_gen: np.ndarray,
+        id_transcript: np.ndarray,
+        conditions: list[str],
+        values: np.ndarray,
+    ):
+        self.id_gen = id_gen
+        self.id_transcript = id_transcript
+        self.conditions = conditions
+        self.values = values
+        # Opaque token of the file version this was loaded from (set by
+        # the repository); stable for as long as that version is served
+        self.version = ""
+        self.columns = pd.Index([*_ID_COLUMNS, *conditions])
+        self._condition_positions = {
+            col: pos for pos, col in enumerate(conditions)
+        }
+        self.gene_index = _build_index(id_gen)
+        self.transcript_index = _build_index(id_transcript)
+        # Derived arrays (row norms, ranks, sorted columns...) kept per
+        # dataset; the setting documents their memory cost
+        self._derived = DatasetCache(
+            max_entries=Config.EXPDB_DERIVED_ENTRIES
+        )
+        self._pinned = DatasetCache(max_entries=_PINNED_ENTRIES)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ExpressionDataset":
+        """
+        Build a dataset from a parsed expression CSV.
+        """
+        conditions = [c for c in df.columns if c not in _ID_COLUMNS]
+        values = np.empty(
+            (len(df), len(conditions)), dtype=np.float64, order="F"
+        )
+        for pos, col in enumerate(conditions):
+            values[:, pos] = to_float_series(df[col])
+        return cls(
+            id_gen=df["id_gen"].to_numpy(dtype=object),
+            id_transcript=df["id_transcript"].to_numpy(dtype=object),
+            conditions=conditions,
+            values=values,
+        )
+
+    def __len__(self) -> int:
+        return len(self.id_gen)
+
+    def memory_usage(self) -> int:
+        """
+        Approximate bytes held by the dataset (IDs, values and indexes).
+        Memory-mapped values are counted at their full size.
+        """
+        ids = sum(
+            pd.Series(col).memory_usage(deep=True, index=False)
+            for col in (self.id_gen, self.id_transcript)
+        )
+        index_rows = sum(
+            rows.nbytes
+            for index in (self.gene_index, self.transcript_index)
+            for rows in index.values()
+        )
+        return int(ids + index_rows + self.values.nbytes)
+
+    def gene_rows(self, gene_id: str) -> np.ndarray:
+        """
+        Row positions for a gene ID (empty if not found).
+        """
+        return self.gene_index.get(gene_id, _EMPTY_ROWS)
+
+    def transcript_rows(self, transcript_id: str) -> np.ndarray:
+        """
+        Row positions for a transcript ID (empty if not found).
+        """
+        return self.transcript_index.get(transcript_id, _EMPTY_ROWS)
+
+    def column_values(self, column: str) -> np.ndarray:
+        """
+        Values of one condition column for every row (a view, not a copy).
+        """
+        return self.values[:, self._condition_positions[column]]
+
+    def block(
+        self,
+        rows: list[int] | np.ndarray,
+        columns: list[str],
+    ) -> np.ndarray:
+        """
+        Values of the given rows (by position) and columns (by name)
+        as a float matrix.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        if not any(col in _ID_COLUMNS for col in columns):
+            positions = [self._condition_positions[col] for col in columns]
+            return self.values[np.ix_(rows, positions)]
+
+        # ID columns may be requested as conditions; they read as
+        # safe_float of the ID text, as they always have
+        block = np.empty((len(rows), len(columns)), dtype=np.float64)
+        for j, col in enumerate(columns):
+            if col in _ID_COLUMNS:
+                block[:, j] = to_float_array(getattr(self, col)[rows])
+            else:
+                block[:, j] = self.values[rows, self._condition_positions[col]]
+        return block
+
+    def derived(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Return the value derived from this dataset under `key`, calling
+        `build` once to compute it (concurrent callers wait for it).
+        """
+        return self._derived.get_or_load(key, self.version, build)
+
+    def pinned(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Like `derived`, for the few values built once per version and kept
+        until the dataset is dropped: their store is never filled by
+        request-dependent keys, so nothing in it is evicted.
+        """
+        return self._pinned.get_or_load(key, self.version, build)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Rebuild the dataset as a DataFrame (ID columns + numeric columns).
+        """
+        df = pd.DataFrame(self.values, columns=self.conditions)
+        df.insert(0, "id_transcript", self.id_transcript)
+        df.insert(0, "id_gen", self.id_gen)
+        return df
+
+
+def _build_index(ids: np.ndarray) -> dict[str, np.ndarray]:
+    # ID -> ascending row positions; missing IDs are not indexed
+    ids = pd.Series(ids)
+    return {
+        key: np.asarray(rows, dtype=np.intp)
+        for key, rows in ids.groupby(ids, sort=False).indices.items()
+    }
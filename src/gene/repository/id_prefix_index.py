@@ -0,0 +1,50 @@
+from bisect import bisect_left
+from typing import Iterable
+from src.gene.repository.expression_dataset import ExpressionDataset
+
+
+class IdPrefixIndex:
+    """
+    Case-insensitive prefix lookups over a set of IDs.
+
+    IDs are kept sorted by their case-folded form, so the IDs starting
+    with a prefix are one contiguous run found by binary search: a lookup
+    costs O(log n + limit) comparisons whatever the number of IDs.
+    """
+
+    def __init__(self, ids: Iterable[str]):
+        pairs = sorted((str(i).casefold(), str(i)) for i in set(ids))
+        self._keys = [key for key, _ in pairs]
+        self._ids = [identifier for _, identifier in pairs]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def match(self, prefix: str, limit: int) -> list[str]:
+        """
+        First `limit` IDs starting with `prefix` (ignoring case), in
+        case-insensitive order.
+        """
+        prefix = prefix.casefold()
+        start = bisect_left(self._keys, prefix)
+        end = min(start + limit, len(self._keys))
+        matched = []
+        for pos in range(start, end):
+            if not self._keys[pos].startswith(prefix):
+                break
+            matched.append(self._ids[pos])
+        return matched
+
+
+def id_prefix_index(dataset: ExpressionDataset, column: str) -> IdPrefixIndex:
+    """
+    Prefix index of the distinct IDs of `column` ("id_gen" or
+    "id_transcript"), built on first use and pinned for the dataset
+    version.
+    """
+    index = (
+        dataset.gene_index if column == "id_gen" else dataset.transcript_index
+    )
+    return dataset.pinned(
+        ("id_prefix", column), lambda: IdPrefixIndex(index.keys())
+    )
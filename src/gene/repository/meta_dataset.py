@@ -0,0 +1,86 @@
+import json
+import pandas as pd
+from src.gene.constants import REQUIRED_META_COLUMNS
+from src.gene.utils.json_provider import RawJSON
+
+# Fields under "information" in a metadata record
+_INFORMATION_FIELDS = [c for c in REQUIRED_META_COLUMNS if c != "library"]
+
+
+class MetaDataset:
+    """
+    A loaded metadata dataset, materialized for serving.
+
+    The response records are built (and serialized) once per dataset
+    version, and every metadata field is indexed by value so filters like
+    `tissue_organ=root` resolve to record positions without a scan.
+    Values are compared case-insensitively.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        # Opaque token of the file version this was loaded from (set by
+        # the repository)
+        self.version = ""
+
+        # Same conversion the endpoint has always applied
+        rows = frame.astype(str).fillna("").to_dict("records")
+
+        self.libraries = [r["library"] for r in rows]
+        self.records = [
+            {
+                "library": r["library"],
+                "information": {f: r[f] for f in _INFORMATION_FIELDS},
+            }
+            for r in rows
+        ]
+        self.fragments = [
+            RawJSON(json.dumps(
+                record, sort_keys=True, separators=(",", ":")
+            ))
+            for record in self.records
+        ]
+
+        self.index: dict[str, dict[str, list[int]]] = {}
+        for field in REQUIRED_META_COLUMNS:
+            values = self.index.setdefault(field, {})
+            for pos, r in enumerate(rows):
+                values.setdefault(r[field].casefold(), []).append(pos)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def memory_usage(self) -> int:
+        """
+        Approximate bytes held by the source frame and the serialized
+        records.
+        """
+        frame = int(self.frame.memory_usage(deep=True).sum())
+        return frame + sum(len(f.text) for f in self.fragments)
+
+    def select(self, filters: dict[str, list[str]]) -> list[int]:
+        """
+        Positions (in file order) of the records matching every field in
+        `filters`, where a field matches any of its values.
+        """
+        selected: set[int] | None = None
+        for field, values in filters.items():
+            index = self.index[field]
+            matches = {
+                pos
+                for value in values
+                for pos in index.get(value.casefold(), ())
+            }
+            selected = matches if selected is None else selected & matches
+        if selected is None:
+            return list(range(len(self.records)))
+        return sorted(selected)
+
+    def libraries_for(self, filters: dict[str, list[str]]) -> list[str]:
+        """
+        Libraries (expression column names) of the records matching
+        `filters`, in file order and without repeats.
+        """
+        return list(dict.fromkeys(
+            self.libraries[pos] for pos in self.select(filters)
+        ))
@@ -0,0 +1,88 @@
+import logging
+import threading
+import warnings
+import numpy as np
+from src.gene.repository.expression_dataset import ExpressionDataset
+
+logger = logging.getLogger(__name__)
+
+# Statistics kept per condition and per row, in column order
+STAT_NAMES = ("count", "mean", "median", "min", "max", "std")
+
+# Rows reduced per step for the per-row statistics (bounds temporary memory)
+_ROW_CHUNK = 65536
+
+
+class SummaryStats:
+    """
+    Summary statistics of an expression dataset, over non-missing values.
+
+    `conditions` holds one row of STAT_NAMES per condition (down each
+    library) and `rows` one row per dataset row (across the libraries of
+    a transcript). `std` is the sample standard deviation (ddof=1), as in
+    pandas; statistics of fewer values than they need are NaN.
+    """
+
+    def __init__(self, conditions: np.ndarray, rows: np.ndarray):
+        self.conditions = conditions
+        self.rows = rows
+
+
+def summary_stats(dataset: ExpressionDataset) -> SummaryStats:
+    """
+    Return the summary statistics of a dataset, computed once per version
+    and pinned on the dataset (concurrent callers wait for one build).
+    """
+    return dataset.pinned(("summary_stats",), lambda: _compute(dataset))
+
+
+def precompute_summary_stats(dataset: ExpressionDataset):
+    """
+    Compute the summary statistics of a freshly loaded dataset in a
+    background thread, so the first stats request finds them ready.
+    """
+    def run():
+        try:
+            summary_stats(dataset)
+        except Exception:
+            logger.warning(
+                "Summary statistics failed for version %s",
+                dataset.version, exc_info=True,
+            )
+
+    threading.Thread(target=run, name="expdb-stats", daemon=True).start()
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _compute(dataset: ExpressionDataset) -> SummaryStats:
+    values = dataset.values
+
+    conditions = np.empty((values.shape[1], len(STAT_NAMES)))
+    for pos in range(values.shape[1]):
+        # Columns are contiguous in the column-major matrix
+        conditions[pos] = _reduce(values[:, pos:pos + 1], axis=0)[0]
+
+    rows = np.empty((values.shape[0], len(STAT_NAMES)))
+    for start in range(0, len(values), _ROW_CHUNK):
+        chunk = np.ascontiguousarray(values[start:start + _ROW_CHUNK])
+        rows[start:start + len(chunk)] = _reduce(chunk, axis=1)
+
+    return SummaryStats(conditions=conditions, rows=rows)
+
+
+def _reduce(block: np.ndarray, axis: int) -> np.ndarray:
+    # STAT_NAMES of `block` along `axis`, one row per reduced vector;
+    # all-missing vectors give NaN (with their warnings silenced)
+    with warnings.catch_warnings(), np.errstate(invalid="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.column_stack([
+            np.count_nonzero(~np.isnan(block), axis=axis).astype(np.float64),
+            np.nanmean(block, axis=axis),
+            np.nanmedian(block, axis=axis),
+            np.nanmin(block, axis=axis),
+            np.nanmax(block, axis=axis),
+            np.nanstd(block, axis=axis, ddof=1),
+        ])
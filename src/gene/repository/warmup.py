@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.config import Config
+from src.gene.repository.csv_repository import (
+    load_expression_dataset,
+    load_meta_dataset,
+)
+from src.gene.repository.summary_stats import summary_stats
+from src.gene.utils.resolve_file import iter_dataset_files
+from src.gene.utils.validators import ALLOWED_DATA_TYPES
+
+logger = logging.getLogger(__name__)
+
+# Warm-up modes (Config.EXPDB_WARMUP)
+WARMUP_OFF = "off"
+WARMUP_SYNC = "sync"
+WARMUP_BACKGROUND = "background"
+
+_lock = threading.Lock()
+_state = {
+    "status": "ready",  # pending | running | ready | failed
+    "mode": WARMUP_OFF,
+    "started_at": None,
+    "finished_at": None,
+    "datasets": [],
+    "error": None,
+}
+
+
+# --------------------
+# FUNCTIONS
+# --------------------
+def start_warm_up(mode: str, max_workers: int):
+    """
+    Start the dataset warm-up in the given mode.
+    - off: nothing is preloaded, the API is ready immediately.
+    - sync: block until every dataset is loaded. Run under
+      `gunicorn --preload` so forked workers inherit the warm cache.
+    - background: load in a daemon thread while requests are served.
+    """
+    mode = (mode or WARMUP_OFF).lower()
+
+    if mode not in {WARMUP_OFF, WARMUP_SYNC, WARMUP_BACKGROUND}:
+        raise ValueError(f"Invalid EXPDB_WARMUP mode: {mode}")
+
+    with _lock:
+        _state["mode"] = mode
+        if mode == WARMUP_OFF:
+            _state["status"] = "ready"
+            return
+        _state["status"] = "pending"
+
+    if mode == WARMUP_SYNC:
+        warm_up(max_workers)
+    else:
+        threading.Thread(
+            target=warm_up,
+            args=(max_workers,),
+            name="expdb-warmup",
+            daemon=True,
+        ).start()
+
+
+def warm_up(max_workers: int) -> list[dict]:
+    """
+    Load and index the latest version of every dataset under EXPDB_PATH.
+    Returns one report per dataset with its load time and memory.
+    """
+    with _lock:
+        _state.update(
+            status="running",
+            started_at=time.time(),
+            finished_at=None,
+            datasets=[],
+            error=None,
+        )
+
+    # Always end in a terminal state: a warm-up stuck in "running" would
+    # keep /ready failing forever
+    status, reports, error = "failed", [], None
+    try:
+        targets = _latest_datasets()
+
+        if len(targets) > Config.DATASET_CACHE_SIZE:
+            logger.warning(
+                "Warm-up found %d datasets but DATASET_CACHE_SIZE is %d; "
+                "the least recently loaded ones will be evicted.",
+                len(targets),
+                Config.DATASET_CACHE_SIZE,
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            reports = list(pool.map(_load_one, targets))
+        status = "ready"
+    except Exception as exc:
+        error = str(exc)
+        logger.exception("Warm-up failed; datasets load on first request.")
+    finally:
+        with _lock:
+            _state.update(
+                status=status,
+                finished_at=time.time(),
+                datasets=reports,
+                error=error,
+            )
+
+    logger.info(
+        "Warm-up finished: %d dataset(s) in %.2fs.",
+        len(reports),
+        _state["finished_at"] - _state["started_at"],
+    )
+    return reports
+
+
+def warmup_status() -> dict:
+    """
+    Return a snapshot of the warm-up state.
+    """
+    with _lock:
+        return {**_state, "datasets": list(_state["datasets"])}
+
+
+def is_ready() -> bool:
+    # A failed warm-up is over too: datasets it did not load are loaded
+    # on their first request
+    with _lock:
+        return _state["status"] in {"ready", "failed"}
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _latest_datasets() -> list[tuple[str, str, str]]:
+    # Distinct (organism, data_type, feature) triples served by the API
+    return sorted({
+        (organism, data_type, feature)
+        for organism, data_type, feature, _, _ in iter_dataset_files()
+        if data_type in ALLOWED_DATA_TYPES or data_type == "meta"
+    })
+
+
+def _load_one(target: tuple[str, str, str]) -> dict:
+    organism, data_type, feature = target
+    report = {
+        "organism": organism,
+        "data_type": data_type,
+        "feature": feature,
+    }
+    start = time.perf_counter()
+
+    try:
+        if data_type == "meta":
+            meta = load_meta_dataset(organism=organism, feature=feature)
+            memory = meta.memory_usage()
+        else:
+            dataset = load_expression_dataset(
+                organism=organism,
+                data_type=data_type,
+                feature=feature,
+            )
+            memory = dataset.memory_usage()
+            # Wait for the statistics too, so forked workers inherit them
+            if Config.EXPDB_SUMMARY_STATS:
+                summary_stats(dataset)
+    except Exception as exc:
+        report.update(
+            status="failed",
+            error=str(exc),
+            seconds=round(time.perf_counter() - start, 3),
+        )
+        logger.error(
+            "Warm-up failed for %s/%s/%s: %s",
+            organism, data_type, feature, exc,
+        )
+        return report
+
+    report.update(
+        status="loaded",
+        seconds=round(time.perf_counter() - start, 3),
+        memory_bytes=memory,
+    )
+    logger.info(
+        "Warm-up loaded %s/%s/%s in %.3fs (%.1f MB).",
+        organism, data_type, feature,
+        report["seconds"], memory / 1e6,
+    )
+    return report
@@ -1,18 +1,88 @@
 # thirdy party
-from flask import Blueprint, request, jsonify
+import re
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    g,
+    jsonify,
+    request,
+    stream_with_context,
+)
 from werkzeug.exceptions import BadRequest
 # local
 from src.gene.services.meta_service import get_meta
-from src.gene.services.gene_service import get_expression_by_gene_id
-from src.gene.services.query_service import get_expression_by_ids
+from src.gene.services.gene_service import (
+    get_expression_by_gene_id,
+    get_expression_block_by_gene_id,
+)
+from src.gene.services.query_service import (
+    get_expression_by_ids,
+    get_expression_block_by_ids,
+    resolve_meta_columns,
+)
+from src.gene.services.expression_helpers import ExpressionBlock
+from src.gene.services.bulk_query_service import stream_expression_by_ids
+from src.gene.services.export_service import InvalidCursorError, export_page
+from src.gene.services.coexpression_service import get_coexpressed
+from src.gene.services.filter_service import filter_expression
+from src.gene.services.autocomplete_service import get_id_suggestions
+from src.gene.services.batch_query_service import query_targets
+from src.gene.services.stats_service import (
+    get_condition_stats,
+    get_row_stats,
+)
 from src.gene.utils.validators import (
     IdsLimitExceededError,
     ValidationError, 
     validate_meta_request, 
     validate_gene_request,
-    validate_expression_query_request)
+    validate_expression_query_request,
+    validate_bulk_query_request,
+    validate_export_request,
+    validate_coexpression_request,
+    validate_filter_request,
+    validate_stats_request,
+    validate_autocomplete_request,
+    validate_batch_query_request,
+    DEFAULT_EXPORT_PAGE_SIZE,
+    DEFAULT_COEXPRESSION_TOP,
+    DEFAULT_FILTER_LIMIT,
+    DEFAULT_AUTOCOMPLETE_LIMIT)
 from src.gene.services.query_service import InvalidColumnsError
-from src.gene.repository.csv_repository import DatasetSchemaError
+from src.gene.repository.csv_repository import (
+    DatasetSchemaError,
+    cache_stats,
+    dataset_version_info,
+    reset_served_versions,
+    served_version_tokens,
+    served_versions,
+)
+from src.gene.utils.response_formats import (
+    UnsupportedFormatError,
+    arrow_body,
+    float32_body,
+    resolve_expression_format,
+)
+from src.gene.utils.response_cache import ResponseCache
+from src.gene.utils.compression import (
+    compress,
+    encoded_response,
+    response_encoding,
+)
+from src.gene.utils.http_cache import (
+    add_validators,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from src.gene.constants import (
+    DATASET_VERSION_HEADER,
+    EXPRESSION_FORMATS,
+    REQUIRED_META_COLUMNS,
+)
+from src.gene.repository.warmup import is_ready, warmup_status
+from src.config import Config
 
 # API codes
 from src.gene.api_codes import (
@@ -28,6 +98,27 @@ from src.gene.api_codes import (
     IDS_LIMIT_EXCEEDED,
     INVALID_COLUMNS,
 
+    EXPORT_PAGE_FOUND,
+    EXPORT_PAGE_EMPTY,
+    INVALID_CURSOR,
+
+    READY,
+    NOT_READY,
+
+    UNSUPPORTED_FORMAT,
+
+    COEXPR_FOUND,
+    COEXPR_NOT_FOUND,
+
+    FILTER_FOUND,
+    FILTER_NOT_FOUND,
+
+    STATS_FOUND,
+    STATS_NOT_FOUND,
+
+    AUTOCOMPLETE_FOUND,
+    AUTOCOMPLETE_NOT_FOUND,
+
     INVALID_JSON,
     INVALID_INPUT,
     FILE_NOT_FOUND,
@@ -39,6 +130,79 @@ from src.gene.api_codes import (
 
 expression_bp  = Blueprint("expression", __name__)
 
+# Serialized bodies of single-gene and /query responses
+_response_cache = ResponseCache(max_bytes=Config.EXPDB_RESPONSE_CACHE_BYTES)
+
+
+# --------------------
+# Dataset version header
+# --------------------
+@expression_bp.before_request
+def _start_version_tracking():
+    reset_served_versions()
+
+
+@expression_bp.after_request
+def _add_version_header(response):
+    # Report which dataset version(s) the response was built from
+    versions = served_versions()
+    if versions:
+        response.headers[DATASET_VERSION_HEADER] = ", ".join(versions)
+    return response
+
+
+@expression_bp.after_request
+def _compress_cached_response(response):
+    # Responses held by the response cache are compressed once per
+    # encoding; the compressed bytes are kept next to the cached body
+    cached = g.get("cached_response")
+    if cached is None:
+        return response
+    cache_key, entry = cached
+
+    encoding = response_encoding(response)
+    if encoding is None:
+        return response
+
+    data = entry.encoded.get(encoding) if entry is not None else None
+    if data is None:
+        data = compress(response.get_data(), encoding)
+        _response_cache.put_encoded(*cache_key, encoding, data)
+    return encoded_response(response, encoding, data)
+
+
+# --------------------
+# Endpoint for readiness
+# --------------------
+@expression_bp.route("/ready", methods=["GET"])
+def readiness():
+    """
+    Readiness probe.
+    Returns 200 once the dataset warm-up has finished, 503 before that.
+    The dataset and response cache counters are included for monitoring.
+    """
+    status = {
+        **warmup_status(),
+        "cache": cache_stats(),
+        "response_cache": _response_cache.stats(),
+    }
+
+    if is_ready():
+        return jsonify({
+            "status": "success",
+            "code": READY,
+            "message": "Service is ready.",
+            "data": status,
+        }), 200
+
+    return jsonify({
+        "status": "error",
+        "code": NOT_READY,
+        "message": "Dataset warm-up in progress.",
+        "data": status,
+    }), 503
+
+
 # --------------------
 # Endpoint for metadata
 # --------------------
@@ -46,24 +210,49 @@ expression_bp  = Blueprint("expression", __name__)
 def expression_meta(organism: str, feature: str):
     """
     Endpoint for querying metadata for a dataset.
+    Metadata fields may be given as query parameters to filter the
+    records, e.g. `?tissue_organ=root&treatment=salt&treatment=drought`
+    (any of the values of a field, all of the fields).
     A response with an array of objects is expected.
     """
     try:
+        filters = _parse_meta_filters()
+
         # Input validation (user)
         validate_meta_request(organism=organism, feature=feature)
 
+        # Conditional request: answered from the dataset version alone
+        version, last_modified = dataset_version_info(
+            organism=organism, data_type="meta", feature=feature
+        )
+        filter_key = tuple(
+            (field, tuple(values)) for field, values in filters.items()
+        )
+        etag = make_etag(version, "meta", repr(filter_key))
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+        # Serialized response of an earlier request
+        dataset = (organism.lower(), "meta", feature.lower())
+        request_key = ("meta", filter_key)
+        response = _cached_response(dataset, version, request_key)
+        if response is not None:
+            return add_validators(response, etag, last_modified), 200
+
         # Data processing (use case)
-        data = get_meta(organism=organism, feature=feature)
+        data = get_meta(organism=organism, feature=feature, filters=filters)
 
         # Standard response (success)
         code = META_FOUND if data else META_NOT_FOUND
         message = "Metadata retrieved successfully."
-        return jsonify({
+        response = jsonify({
             "status": "success",
             "code": code,
             "message": message,
             "data": data,
-        }), 200
+        })
+        _cache_response(dataset, version, request_key, response)
+        return add_validators(response, etag, last_modified), 200
 
 
     # User input errors
@@ -135,6 +324,47 @@ def expression_by_gene_id(
             gene_id=gene_id,
         )
 
+        output_format = resolve_expression_format(
+            request.args.get("format"), request.accept_mimetypes
+        )
+
+        # Conditional request: answered from the dataset version alone
+        version, last_modified = dataset_version_info(
+            organism=organism, data_type=data_type, feature=feature
+        )
+        etag = make_etag(version, "gene", gene_id, output_format)
+        if is_not_modified(etag, last_modified):
+            response = not_modified_response(etag, last_modified)
+            response.vary.add("Accept")
+            return response
+
+        # Serialized response of an earlier identical request
+        dataset = (organism.lower(), data_type, feature)
+        request_key = ("gene", gene_id, output_format)
+        response = _cached_response(dataset, version, request_key)
+        if response is not None:
+            response.vary.add("Accept")
+            return add_validators(response, etag, last_modified), 200
+
+        # Compact formats (columnar / float32 / arrow)
+        if output_format != "records":
+            block = get_expression_block_by_gene_id(
+                organism=organism,
+                data_type=data_type,
+                feature=feature,
+                gene_id=gene_id,
+            )
+            summary = {
+                "status": "success",
+                "code": EXPR_FOUND if len(block) else EXPR_NOT_FOUND,
+                "message": f"Expression data retrieved for gene '{gene_id}'.",
+            }
+            response = _expression_block_response(
+                output_format, summary, block, {}
+            )
+            _cache_response(dataset, version, request_key, response)
+            return add_validators(response, etag, last_modified), 200
+
         # Data processing (use case)
         data = get_expression_by_gene_id(
             organism=organism,
@@ -146,12 +376,23 @@ def expression_by_gene_id(
         # Standard response (success)
         code = EXPR_FOUND if data else EXPR_NOT_FOUND
         message = f"Expression data retrieved for gene '{gene_id}'."
-        return jsonify({
+        response = jsonify({
             "status": "success",
             "code": code,
             "message": message,
             "data": data,
-        }), 200
+        })
+        response.vary.add("Accept")
+        _cache_response(dataset, version, request_key, response)
+        return add_validators(response, etag, last_modified), 200
+
+    except UnsupportedFormatError as e:
+        return jsonify({
+            "status": "error",
+            "code": UNSUPPORTED_FORMAT,
+            "message": str(e),
+            "data": [],
+        }), 406
 
     # User input errors
     except ValidationError as e:
@@ -211,6 +452,8 @@ def expression_by_ids(organism: str, data_type: str, feature: str):
         “ids”: ['id1', 'id2', ...],
         “columns”: ['cond1', 'cond2', ...]
     }
+    Instead of “columns”, a “meta” object of metadata filters may select
+    the columns, e.g. {"tissue_organ": "root", "treatment": ["salt"]}.
     A response with an array of objects is expected.
     """
     try:
@@ -228,6 +471,7 @@ def expression_by_ids(organism: str, data_type: str, feature: str):
 
         ids = body.get("ids", [])
         columns = body.get("columns", [])
+        meta = body.get("meta")
 
         # Input validation (user)
         validate_expression_query_request(
@@ -235,8 +479,55 @@ def expression_by_ids(organism: str, data_type: str, feature: str):
             data_type=data_type,
             feature=feature,
             ids=ids,
-            columns=columns
+            columns=columns,
+            meta=meta,
+        )
+
+        # Columns selected by metadata filters
+        if meta is not None:
+            columns = resolve_meta_columns(
+                organism=organism,
+                data_type=data_type,
+                feature=feature,
+                meta=meta,
+            )
+
+        output_format = resolve_expression_format(
+            request.args.get("format"), request.accept_mimetypes
+        )
+
+        # Serialized response of an earlier identical request
+        version, _ = dataset_version_info(
+            organism=organism, data_type=data_type, feature=feature
         )
+        dataset = (organism.lower(), data_type, feature)
+        request_key = ("query", tuple(ids), tuple(columns), output_format)
+        response = _cached_response(dataset, version, request_key)
+        if response is not None:
+            response.vary.add("Accept")
+            return response, 200
+
+        # Compact formats (columnar / float32 / arrow)
+        if output_format != "records":
+            block, not_found_ids = get_expression_block_by_ids(
+                organism=organism,
+                data_type=data_type,
+                feature=feature,
+                ids=ids,
+                columns=columns
+            )
+            code, message = _multi_expr_status(len(block), not_found_ids)
+            summary = {
+                "status": "success",
+                "code": code,
+                "message": message,
+            }
+            extra = {"not_found_ids": not_found_ids} if not_found_ids else {}
+            response = _expression_block_response(
+                output_format, summary, block, extra
+            )
+            _cache_response(dataset, version, request_key, response)
+            return response, 200
 
         # Data processing (use case)
         data, not_found_ids  = get_expression_by_ids(
@@ -269,7 +560,10 @@ def expression_by_ids(organism: str, data_type: str, feature: str):
         if not_found_ids:
             response["not_found_ids"] = not_found_ids
 
-        return jsonify(response), 200
+        response = jsonify(response)
+        response.vary.add("Accept")
+        _cache_response(dataset, version, request_key, response)
+        return response, 200
 
     except IdsLimitExceededError as e:
         return jsonify({
@@ -287,6 +581,170 @@ def expression_by_ids(organism: str, data_type: str, feature: str):
             "data": []
         }), 400
 
+    except UnsupportedFormatError as e:
+        return jsonify({
+            "status": "error",
+            "code": UNSUPPORTED_FORMAT,
+            "message": str(e),
+            "data": [],
+        }), 406
+
+    # User input errors
+    except ValidationError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # Resource not found
+    except FileNotFoundError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_NOT_FOUND,
+            "message": str(e),
+            "data": []
+        }), 404
+
+    # File read error
+    except IOError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_READ_ERROR,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Invalid dataset
+    except DatasetSchemaError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_DATASET,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Unexpected error
+    except Exception:
+        return jsonify({
+            "status": "error",
+            "code": INTERNAL_ERROR,
+            "message": "Internal server error.",
+            "data": [],
+        }), 500
+
+
+# --------------------
+# BULK IDS QUERY ENDPOINT (streamed)
+# --------------------
+BULK_FORMATS = {"ndjson", "json"}
+
+@expression_bp.route(
+    "/<organism>/<data_type>/<feature>/query/bulk", methods=["POST"]
+)
+def expression_by_ids_bulk(organism: str, data_type: str, feature: str):
+    """
+    Endpoint for querying thousands of gene/transcript expressions.
+    Accepts the same JSON body as /query:
+    {
+        "ids": ['id1', 'id2', ...],
+        "columns": ['cond1', 'cond2', ...]
+    }
+    or a multipart upload with an `ids` file (IDs separated by newlines,
+    commas or spaces) and a `columns` form field.
+
+    The response is streamed. `?format=ndjson` (default) sends one record
+    per line followed by a summary line with `not_found_ids`;
+    `?format=json` sends the /query envelope as chunked JSON.
+    """
+    try:
+        ids, columns = _parse_bulk_body()
+    except BadRequest:
+        # Invalid JSON body
+        return jsonify({
+            "status": "error",
+            "code": INVALID_JSON,
+            "message": "Invalid JSON body, please verify.",
+            "data": []
+        }), 400
+    except UnicodeDecodeError:
+        # Uploaded ids file is not UTF-8 text
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": "The ids file must be UTF-8 text.",
+            "data": []
+        }), 400
+
+    try:
+        output_format = request.args.get("format", "ndjson").lower()
+        if output_format not in BULK_FORMATS:
+            raise ValidationError(
+                f"Invalid format. Expected one of {BULK_FORMATS}."
+            )
+
+        # Input validation (user)
+        validate_bulk_query_request(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            ids=ids,
+            columns=columns
+        )
+
+        # Data processing (use case); records are built while streaming
+        count, not_found_ids, chunks = stream_expression_by_ids(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            ids=ids,
+            columns=columns
+        )
+
+        # Dynamic message
+        if count and not not_found_ids:
+            code = MULTI_EXPR_FOUND
+            message = f"Expression data retrieved for {count} record(s)."
+        elif count and not_found_ids:
+            code = MULTI_EXPR_PARTIAL
+            message = f"Expression data retrieved for {count} record(s). {len(not_found_ids)} ID(s) were not found."
+        else:
+            code = MULTI_EXPR_NOT_FOUND
+            message = "No expression data found for the given IDs."
+
+        summary = {
+            "status": "success",
+            "code": code,
+            "message": message,
+        }
+
+        if output_format == "ndjson":
+            body = _stream_ndjson(chunks, summary, not_found_ids)
+            mimetype = "application/x-ndjson"
+        else:
+            extra = {"not_found_ids": not_found_ids} if not_found_ids else {}
+            body = _stream_json(chunks, summary, extra)
+            mimetype = "application/json"
+
+        return Response(stream_with_context(body), mimetype=mimetype), 200
+
+    except IdsLimitExceededError as e:
+        return jsonify({
+            "status": "error",
+            "code": IDS_LIMIT_EXCEEDED,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    except InvalidColumnsError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_COLUMNS,
+            "message": str(e),
+            "data": []
+        }), 400
+
     # User input errors
     except ValidationError as e:
         return jsonify({
@@ -331,3 +789,922 @@ def expression_by_ids(organism: str, data_type: str, feature: str):
             "message": "Internal server error.",
             "data": [],
         }), 500
+
+
+# --------------------
+# DATASET EXPORT ENDPOINT (paginated, streamed)
+# --------------------
+@expression_bp.route("/<organism>/<data_type>/<feature>/export", methods=["GET"])
+def expression_export(organism: str, data_type: str, feature: str):
+    """
+    Endpoint for exporting a whole expression dataset page by page.
+    Query parameters:
+    - limit: page size (default 1000, max 10000).
+    - cursor: `next_cursor` of the previous page (omit for the first page).
+    - columns: optional condition columns (repeated or comma-separated).
+    The page is streamed with the standard envelope plus `next_cursor`
+    (null on the last page), `total` and `dataset_version`.
+    """
+    try:
+        limit = request.args.get("limit", str(DEFAULT_EXPORT_PAGE_SIZE))
+        cursor = request.args.get("cursor") or None
+        columns = _parse_list_arg("columns") or None
+
+        # Input validation (user)
+        validate_export_request(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            limit=limit,
+            columns=columns,
+        )
+
+        # Data processing (use case); records are built while streaming
+        info, chunks = export_page(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            columns=columns,
+            cursor=cursor,
+            limit=int(limit),
+        )
+
+        code = EXPORT_PAGE_FOUND if info["count"] else EXPORT_PAGE_EMPTY
+        message = f"Exported {info['count']} of {info['total']} record(s)."
+        summary = {
+            "status": "success",
+            "code": code,
+            "message": message,
+        }
+        extra = {
+            "dataset_version": info["dataset_version"],
+            "next_cursor": info["next_cursor"],
+            "total": info["total"],
+        }
+
+        body = _stream_json(chunks, summary, extra)
+        return Response(
+            stream_with_context(body), mimetype="application/json"
+        ), 200
+
+    except InvalidCursorError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_CURSOR,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    except InvalidColumnsError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_COLUMNS,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # User input errors
+    except ValidationError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # Resource not found
+    except FileNotFoundError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_NOT_FOUND,
+            "message": str(e),
+            "data": []
+        }), 404
+
+    # File read error
+    except IOError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_READ_ERROR,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Invalid dataset
+    except DatasetSchemaError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_DATASET,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Unexpected error
+    except Exception:
+        return jsonify({
+            "status": "error",
+            "code": INTERNAL_ERROR,
+            "message": "Internal server error.",
+            "data": [],
+        }), 500
+
+
+# --------------------
+# CO-EXPRESSION ENDPOINT
+# --------------------
+@expression_bp.route(
+    "/<organism>/<data_type>/<feature>/coexpression", methods=["GET"]
+)
+def expression_coexpression(organism: str, data_type: str, feature: str):
+    """
+    Endpoint for finding the transcripts most correlated with a gene or
+    transcript.
+    Query parameters:
+    - id: gene, transcript or miRNA ID.
+    - n: number of results (default 50, max 1000).
+    - method: pearson (default) or spearman.
+    - columns: optional condition columns (repeated or comma-separated).
+    A response with one object per query row is expected.
+    """
+    try:
+        query_id = request.args.get("id", "")
+        top = request.args.get("n", str(DEFAULT_COEXPRESSION_TOP))
+        method = request.args.get("method", "pearson").lower()
+        columns = _parse_list_arg("columns") or None
+
+        # Input validation (user)
+        validate_coexpression_request(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            query_id=query_id,
+            top=top,
+            method=method,
+            columns=columns,
+        )
+
+        # Conditional request: answered from the dataset version alone
+        version, last_modified = dataset_version_info(
+            organism=organism, data_type=data_type, feature=feature
+        )
+        request_key = (
+            "coexpression", query_id, int(top), method,
+            tuple(columns) if columns else None,
+        )
+        etag = make_etag(version, repr(request_key))
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+        # Serialized response of an earlier identical request
+        dataset = (organism.lower(), data_type, feature)
+        response = _cached_response(dataset, version, request_key)
+        if response is not None:
+            return add_validators(response, etag, last_modified), 200
+
+        # Data processing (use case)
+        data = get_coexpressed(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            query_id=query_id,
+            columns=columns,
+            top=int(top),
+            method=method,
+        )
+
+        # Standard response (success)
+        code = COEXPR_FOUND if data else COEXPR_NOT_FOUND
+        message = f"Co-expression ({method}) retrieved for '{query_id}'."
+        response = jsonify({
+            "status": "success",
+            "code": code,
+            "message": message,
+            "data": data,
+        })
+        _cache_response(dataset, version, request_key, response)
+        return add_validators(response, etag, last_modified), 200
+
+    except InvalidColumnsError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_COLUMNS,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # User input errors
+    except ValidationError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # Resource not found
+    except FileNotFoundError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_NOT_FOUND,
+            "message": str(e),
+            "data": []
+        }), 404
+
+    # File read error
+    except IOError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_READ_ERROR,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Invalid dataset
+    except DatasetSchemaError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_DATASET,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Unexpected error
+    except Exception:
+        return jsonify({
+            "status": "error",
+            "code": INTERNAL_ERROR,
+            "message": "Internal server error.",
+            "data": [],
+        }), 500
+
+
+# --------------------
+# VALUE FILTER ENDPOINT
+# --------------------
+@expression_bp.route("/<organism>/<data_type>/<feature>/filter", methods=["POST"])
+def expression_filter(organism: str, data_type: str, feature: str):
+    """
+    Endpoint for finding the rows whose values match per-condition filters.
+    Expects to receive a JSON with:
+    {
+        "filters": [
+            {"column": "cond1", "op": ">", "value": 2},
+            {"column": "cond2", "op": "between", "value": [0, 1]},
+            {"column": "cond3", "op": "abs>", "value": 1.5}
+        ],
+        "combine": "and" | "or",        (optional, default "and")
+        "columns": ['cond1', ...],      (optional, default all conditions)
+        "limit": 100                    (optional, max 1000)
+    }
+    A response with an array of objects (as for /query) is expected.
+    """
+    try:
+        body = request.get_json()
+    except BadRequest:
+        # Invalid JSON body
+        return jsonify({
+            "status": "error",
+            "code": INVALID_JSON,
+            "message": "Invalid JSON body, please verify.",
+            "data": []
+        }), 400
+
+    try:
+
+        if not isinstance(body, dict):
+            raise ValidationError("Request body must be a JSON object.")
+
+        filters = body.get("filters", [])
+        combine = str(body.get("combine", "and")).lower()
+        columns = body.get("columns")
+        limit = body.get("limit", DEFAULT_FILTER_LIMIT)
+
+        # Input validation (user)
+        validate_filter_request(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            filters=filters,
+            combine=combine,
+            limit=limit,
+            columns=columns,
+        )
+
+        # Serialized response of an earlier identical request
+        version, _ = dataset_version_info(
+            organism=organism, data_type=data_type, feature=feature
+        )
+        dataset = (organism.lower(), data_type, feature)
+        request_key = (
+            "filter",
+            tuple((f["column"], f["op"], repr(f["value"])) for f in filters),
+            combine,
+            tuple(columns) if columns else None,
+            limit,
+        )
+        response = _cached_response(dataset, version, request_key)
+        if response is not None:
+            return response, 200
+
+        # Data processing (use case)
+        data, total = filter_expression(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            filters=filters,
+            combine=combine,
+            columns=columns,
+            limit=limit,
+        )
+
+        # Standard response (success)
+        code = FILTER_FOUND if data else FILTER_NOT_FOUND
+        message = f"{len(data)} of {total} matching rows retrieved."
+        response = jsonify({
+            "status": "success",
+            "code": code,
+            "message": message,
+            "total_matches": total,
+            "data": data,
+        })
+        _cache_response(dataset, version, request_key, response)
+        return response, 200
+
+    except InvalidColumnsError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_COLUMNS,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # User input errors
+    except ValidationError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # Resource not found
+    except FileNotFoundError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_NOT_FOUND,
+            "message": str(e),
+            "data": []
+        }), 404
+
+    # File read error
+    except IOError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_READ_ERROR,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Invalid dataset
+    except DatasetSchemaError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_DATASET,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Unexpected error
+    except Exception:
+        return jsonify({
+            "status": "error",
+            "code": INTERNAL_ERROR,
+            "message": "Internal server error.",
+            "data": [],
+        }), 500
+
+
+# --------------------
+# SUMMARY STATISTICS ENDPOINT
+# --------------------
+@expression_bp.route("/<organism>/<data_type>/<feature>/stats", methods=["GET"])
+def expression_stats(organism: str, data_type: str, feature: str):
+    """
+    Endpoint for summary statistics (count, mean, median, min, max, std).
+    Query parameters:
+    - axis: conditions (default, one object per library) or rows (one
+      object per transcript, across libraries).
+    - columns: optional conditions (axis=conditions).
+    - ids: gene / transcript IDs (axis=rows, required).
+    Both lists may be repeated or comma-separated.
+    A response with an array of objects is expected.
+    """
+    try:
+        axis = request.args.get("axis", "conditions").lower()
+        ids = _parse_list_arg("ids")
+        columns = _parse_list_arg("columns") or None
+
+        # Input validation (user)
+        validate_stats_request(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            axis=axis,
+            ids=ids,
+            columns=columns,
+        )
+
+        # Conditional request: answered from the dataset version alone
+        version, last_modified = dataset_version_info(
+            organism=organism, data_type=data_type, feature=feature
+        )
+        request_key = (
+            "stats", axis, tuple(ids), tuple(columns) if columns else None
+        )
+        etag = make_etag(version, repr(request_key))
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+        # Serialized response of an earlier identical request
+        dataset = (organism.lower(), data_type, feature)
+        response = _cached_response(dataset, version, request_key)
+        if response is not None:
+            return add_validators(response, etag, last_modified), 200
+
+        # Data processing (use case)
+        not_found_ids = []
+        if axis == "rows":
+            data, not_found_ids = get_row_stats(
+                organism=organism,
+                data_type=data_type,
+                feature=feature,
+                ids=ids,
+            )
+        else:
+            data = get_condition_stats(
+                organism=organism,
+                data_type=data_type,
+                feature=feature,
+                columns=columns,
+            )
+
+        # Standard response (success)
+        code = STATS_FOUND if data else STATS_NOT_FOUND
+        payload = {
+            "status": "success",
+            "code": code,
+            "message": f"Summary statistics retrieved for {len(data)} {axis}.",
+            "data": data,
+        }
+        if not_found_ids:
+            payload["not_found_ids"] = not_found_ids
+        response = jsonify(payload)
+        _cache_response(dataset, version, request_key, response)
+        return add_validators(response, etag, last_modified), 200
+
+    except IdsLimitExceededError as e:
+        return jsonify({
+            "status": "error",
+            "code": IDS_LIMIT_EXCEEDED,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    except InvalidColumnsError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_COLUMNS,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # User input errors
+    except ValidationError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # Resource not found
+    except FileNotFoundError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_NOT_FOUND,
+            "message": str(e),
+            "data": []
+        }), 404
+
+    # File read error
+    except IOError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_READ_ERROR,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Invalid dataset
+    except DatasetSchemaError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_DATASET,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Unexpected error
+    except Exception:
+        return jsonify({
+            "status": "error",
+            "code": INTERNAL_ERROR,
+            "message": "Internal server error.",
+            "data": [],
+        }), 500
+
+
+# --------------------
+# ID AUTOCOMPLETE ENDPOINT
+# --------------------
+@expression_bp.route(
+    "/<organism>/<data_type>/<feature>/autocomplete", methods=["GET"]
+)
+def expression_autocomplete(organism: str, data_type: str, feature: str):
+    """
+    Endpoint for suggesting gene / transcript IDs from a partial ID.
+    Query parameters:
+    - q: ID prefix (case-insensitive).
+    - limit: IDs per list (default 10, max 100).
+    A response with "genes" and "transcripts" ID lists is expected.
+    """
+    try:
+        prefix = request.args.get("q", "").strip()
+        limit = request.args.get("limit", str(DEFAULT_AUTOCOMPLETE_LIMIT))
+
+        # Input validation (user)
+        validate_autocomplete_request(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            prefix=prefix,
+            limit=limit,
+        )
+
+        # Conditional request: answered from the dataset version alone
+        version, last_modified = dataset_version_info(
+            organism=organism, data_type=data_type, feature=feature
+        )
+        request_key = ("autocomplete", prefix.casefold(), int(limit))
+        etag = make_etag(version, repr(request_key))
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+        # Serialized response of an earlier identical request
+        dataset = (organism.lower(), data_type, feature)
+        response = _cached_response(dataset, version, request_key)
+        if response is not None:
+            return add_validators(response, etag, last_modified), 200
+
+        # Data processing (use case)
+        data = get_id_suggestions(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            prefix=prefix,
+            limit=int(limit),
+        )
+
+        # Standard response (success)
+        found = data["genes"] or data["transcripts"]
+        response = jsonify({
+            "status": "success",
+            "code": AUTOCOMPLETE_FOUND if found else AUTOCOMPLETE_NOT_FOUND,
+            # Shared by every casing of the prefix (see request_key), so
+            # the message must not echo it
+            "message": (
+                f"{len(data['genes'])} gene and "
+                f"{len(data['transcripts'])} transcript ID(s) retrieved."
+            ),
+            "data": data,
+        })
+        _cache_response(dataset, version, request_key, response)
+        return add_validators(response, etag, last_modified), 200
+
+    # User input errors
+    except ValidationError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # Resource not found
+    except FileNotFoundError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_NOT_FOUND,
+            "message": str(e),
+            "data": []
+        }), 404
+
+    # File read error
+    except IOError as e:
+        return jsonify({
+            "status": "error",
+            "code": FILE_READ_ERROR,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Invalid dataset
+    except DatasetSchemaError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_DATASET,
+            "message": str(e),
+            "data": []
+        }), 500
+
+    # Unexpected error
+    except Exception:
+        return jsonify({
+            "status": "error",
+            "code": INTERNAL_ERROR,
+            "message": "Internal server error.",
+            "data": [],
+        }), 500
+
+
+# --------------------
+# MULTI-DATASET QUERY ENDPOINT
+# --------------------
+@expression_bp.route("/batch/query", methods=["POST"])
+def expression_batch_query():
+    """
+    Endpoint for querying the same IDs in several datasets at once.
+    Expects to receive a JSON with:
+    {
+        "targets": [
+            {"organism": "org1", "data_type": "raw", "feature": "genes"},
+            {"organism": "org1", "data_type": "scorez", "feature": "genes",
+             "columns": ['cond1', ...]}                  (optional)
+        ],
+        "ids": ['id1', 'id2', ...],
+        "columns": ['cond1', 'cond2', ...]     (or "meta": {...} filters)
+    }
+    A response with one object per target, in target order, is expected.
+    Each holds that dataset's records and not_found_ids, or its error.
+    """
+    try:
+        body = request.get_json()
+    except BadRequest:
+        # Invalid JSON body
+        return jsonify({
+            "status": "error",
+            "code": INVALID_JSON,
+            "message": "Invalid JSON body, please verify.",
+            "data": []
+        }), 400
+
+    try:
+
+        if not isinstance(body, dict):
+            raise ValidationError("Request body must be a JSON object.")
+
+        targets = body.get("targets", [])
+        ids = body.get("ids", [])
+        columns = body.get("columns")
+        meta = body.get("meta")
+
+        # Input validation (user)
+        validate_batch_query_request(
+            targets=targets,
+            ids=ids,
+            columns=columns,
+            meta=meta,
+        )
+
+        # Data processing (use case), one thread per target
+        results = query_targets(
+            targets=targets,
+            ids=ids,
+            columns=columns,
+            meta=meta,
+        )
+
+        data = []
+        for target, result in zip(targets, results):
+            entry = {
+                "organism": target["organism"],
+                "data_type": target["data_type"],
+                "feature": target["feature"],
+            }
+            if isinstance(result, Exception):
+                code, message = _target_error(result)
+                entry.update(
+                    status="error", code=code, message=message, data=[]
+                )
+            else:
+                records, not_found_ids = result
+                code, message = _multi_expr_status(len(records), not_found_ids)
+                entry.update(
+                    status="success",
+                    code=code,
+                    message=message,
+                    data=records,
+                    not_found_ids=not_found_ids,
+                )
+            data.append(entry)
+
+        # Standard response (success)
+        count = sum(len(entry["data"]) for entry in data)
+        if not count:
+            code = MULTI_EXPR_NOT_FOUND
+        elif all(entry["code"] == MULTI_EXPR_FOUND for entry in data):
+            code = MULTI_EXPR_FOUND
+        else:
+            code = MULTI_EXPR_PARTIAL
+        return jsonify({
+            "status": "success",
+            "code": code,
+            "message": f"Expression data retrieved for {count} record(s) from {len(data)} dataset(s).",
+            "data": data,
+        }), 200
+
+    except IdsLimitExceededError as e:
+        return jsonify({
+            "status": "error",
+            "code": IDS_LIMIT_EXCEEDED,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # User input errors
+    except ValidationError as e:
+        return jsonify({
+            "status": "error",
+            "code": INVALID_INPUT,
+            "message": str(e),
+            "data": []
+        }), 400
+
+    # Unexpected error
+    except Exception:
+        return jsonify({
+            "status": "error",
+            "code": INTERNAL_ERROR,
+            "message": "Internal server error.",
+            "data": [],
+        }), 500
+
+
+def _multi_expr_status(count: int, not_found_ids: list[str]) -> tuple[str, str]:
+    # Code and message of a multi-ID query result
+    if count and not not_found_ids:
+        return MULTI_EXPR_FOUND, f"Expression data retrieved for {count} record(s)."
+    if count and not_found_ids:
+        return MULTI_EXPR_PARTIAL, f"Expression data retrieved for {count} record(s). {len(not_found_ids)} ID(s) were not found."
+    return MULTI_EXPR_NOT_FOUND, "No expression data found for the given IDs."
+
+
+def _target_error(exc: Exception) -> tuple[str, str]:
+    # Code and message of a failed target of a multi-dataset query
+    if isinstance(exc, InvalidColumnsError):
+        return INVALID_COLUMNS, str(exc)
+    if isinstance(exc, ValidationError):
+        return INVALID_INPUT, str(exc)
+    if isinstance(exc, FileNotFoundError):
+        return FILE_NOT_FOUND, str(exc)
+    if isinstance(exc, IOError):
+        return FILE_READ_ERROR, str(exc)
+    if isinstance(exc, DatasetSchemaError):
+        return INVALID_DATASET, str(exc)
+    return INTERNAL_ERROR, "Internal server error."
+
+
+def _expression_block_response(
+    output_format: str,
+    summary: dict,
+    block: ExpressionBlock,
+    extra: dict,
+) -> Response:
+    # Compact expression formats of /query and the single-gene endpoint
+    if output_format == "columnar":
+        response = jsonify({**summary, "data": block.to_columnar(), **extra})
+    else:
+        encode = float32_body if output_format == "float32" else arrow_body
+        response = Response(encode(
+            {**summary, **extra},
+            block.conditions,
+            block.id_gen,
+            block.id_transcript,
+            block.values,
+        ))
+    response.mimetype = EXPRESSION_FORMATS[output_format]
+    response.vary.add("Accept")
+    return response
+
+
+def _cached_response(
+    dataset: tuple[str, str, str],
+    version: str,
+    request_key: tuple,
+) -> Response | None:
+    # Response rebuilt from a cached body, or None on a miss
+    entry = _response_cache.get(dataset, version, request_key)
+    if entry is None:
+        return None
+    g.cached_response = ((dataset, version, request_key), entry)
+    return Response(entry.body, content_type=entry.content_type)
+
+
+def _cache_response(
+    dataset: tuple[str, str, str],
+    version: str,
+    request_key: tuple,
+    response: Response,
+):
+    # Only bodies built entirely from `version` are kept (a newer version
+    # may have been swapped in while the request was being handled)
+    if served_version_tokens(dataset) == [version]:
+        _response_cache.put(
+            dataset,
+            version,
+            request_key,
+            response.content_type,
+            response.get_data(),
+        )
+        g.cached_response = ((dataset, version, request_key), None)
+
+
+def _parse_list_arg(name: str) -> list[str]:
+    # Values of a query parameter that may be repeated or comma-separated
+    return [
+        v.strip()
+        for field in request.args.getlist(name)
+        for v in field.split(",")
+        if v.strip()
+    ]
+
+
+def _parse_meta_filters() -> dict[str, list[str]]:
+    # Metadata field filters from the query string (a field may be
+    # repeated; other parameters are ignored). Fields and values are
+    # sorted, as they do not affect the response.
+    filters = {}
+    for field in sorted(REQUIRED_META_COLUMNS):
+        values = sorted({
+            v.strip() for v in request.args.getlist(field) if v.strip()
+        })
+        if values:
+            filters[field] = values
+    return filters
+
+
+def _parse_bulk_body() -> tuple[list, list]:
+    # IDs and columns from a multipart upload or a JSON body
+    if request.mimetype == "multipart/form-data":
+        upload = request.files.get("ids")
+        text = upload.read().decode("utf-8-sig") if upload else ""
+        ids = [i for i in re.split(r"[\s,]+", text) if i]
+        columns = [
+            c.strip()
+            for field in request.form.getlist("columns")
+            for c in field.split(",")
+            if c.strip()
+        ]
+        return ids, columns
+
+    body = request.get_json()
+    if not isinstance(body, dict):
+        raise BadRequest()
+    return body.get("ids", []), body.get("columns", [])
+
+
+def _compact_dumps(obj) -> str:
+    # Same compact separators jsonify uses for responses
+    return current_app.json.dumps(obj, separators=(",", ":"))
+
+
+def _stream_ndjson(chunks, summary: dict, not_found_ids: list[str]):
+    dumps = _compact_dumps
+    for chunk in chunks:
+        yield "".join(dumps(record) + "\n" for record in chunk)
+    yield dumps({**summary, "not_found_ids": not_found_ids}) + "\n"
+
+
+def _stream_json(chunks, summary: dict, extra: dict):
+    # Standard envelope with `data` written one chunk at a time;
+    # `extra` keys follow the data array
+    dumps = _compact_dumps
+    yield dumps(summary)[:-1] + ',"data":['
+    separator = ""
+    for chunk in chunks:
+        parts = []
+        for record in chunk:
+            parts.append(separator + dumps(record))
+            separator = ","
+        yield "".join(parts)
+    yield "]" + ("," + dumps(extra)[1:] if extra else "}")
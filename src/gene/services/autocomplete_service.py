@@ -0,0 +1,35 @@
+from src.gene.repository.csv_repository import load_expression_dataset
+from src.gene.repository.id_prefix_index import id_prefix_index
+
+
+def get_id_suggestions(
+    organism: str,
+    data_type: str,
+    feature: str,
+    prefix: str,
+    limit: int,
+) -> dict[str, list[str]]:
+    """
+    Return the IDs of a dataset starting with a prefix (case-insensitive).
+    The response is a dictionary containing:
+    - "genes": Up to `limit` gene (or miRNA) IDs.
+    - "transcripts": Up to `limit` transcript IDs (always empty for miRNA,
+      whose rows are looked up by their ID alone).
+    IDs are distinct and in case-insensitive order.
+    """
+
+    dataset = load_expression_dataset(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+    )
+
+    genes = id_prefix_index(dataset, "id_gen").match(prefix, limit)
+
+    transcripts = []
+    if feature == "genes":
+        transcripts = id_prefix_index(dataset, "id_transcript").match(
+            prefix, limit
+        )
+
+    return {"genes": genes, "transcripts": transcripts}
@@ -0,0 +1,92 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from src.config import Config
+from src.gene.repository.csv_repository import (
+    record_served_state,
+    reset_served_versions,
+    served_version_state,
+)
+from src.gene.services.query_service import (
+    get_expression_by_ids,
+    resolve_meta_columns,
+)
+
+# Shared by all requests of the process; threads start on first use
+_executor = ThreadPoolExecutor(
+    max_workers=max(1, Config.EXPDB_BATCH_WORKERS),
+    thread_name_prefix="expdb-batch",
+)
+
+
+def query_targets(
+    targets: list[dict],
+    ids: list[str],
+    columns: list[str] | None,
+    meta: dict | None,
+) -> list[tuple[list[dict], list[str]] | Exception]:
+    """
+    Run the same ID query against several datasets concurrently.
+    Each target is {"organism", "data_type", "feature"} and may hold its
+    own "columns"; otherwise `columns`, or the libraries matching the
+    `meta` filters in that dataset, are used.
+    Returns one result per target, in target order: (records, IDs not
+    found) as from `get_expression_by_ids`, or the exception it raised,
+    so one failing dataset does not fail the others.
+
+    Versions served by each target are recorded in the calling request
+    (in target order), as if the lookups had run on its thread.
+    """
+
+    def run(target: dict):
+        # Runs in a copy of the request context with its own version
+        # record, returned alongside the result
+        reset_served_versions()
+        try:
+            result = _query_target(target, ids, columns, meta)
+        except Exception as exc:
+            result = exc
+        return result, served_version_state()
+
+    futures = [
+        _executor.submit(contextvars.copy_context().run, run, target)
+        for target in targets
+    ]
+
+    results = []
+    for future in futures:
+        result, served = future.result()
+        record_served_state(served)
+        results.append(result)
+    return results
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _query_target(
+    target: dict,
+    ids: list[str],
+    columns: list[str] | None,
+    meta: dict | None,
+) -> tuple[list[dict], list[str]]:
+    organism = target["organism"]
+    data_type = target["data_type"]
+    feature = target["feature"]
+
+    columns = target.get("columns") or columns
+    if not columns:
+        columns = resolve_meta_columns(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            meta=meta,
+        )
+
+    return get_expression_by_ids(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+        ids=ids,
+        columns=columns,
+    )
@@ -0,0 +1,45 @@
+from typing import Iterator
+from src.gene.services.query_service import (
+    build_records,
+    load_query_dataset,
+    select_rows,
+)
+
+# Records built (and serialized) per step of a streamed response
+BULK_CHUNK_SIZE = 500
+
+
+def stream_expression_by_ids(
+    organism: str,
+    data_type: str,
+    feature: str,
+    ids: list[str],
+    columns: list[str],
+) -> tuple[int, list[str], Iterator[list[dict]]]:
+    """
+    Resolve a large list of gene or transcript IDs for streaming.
+    IDs are resolved through the dataset indexes up front, so errors are
+    raised before anything is streamed and cost stays linear in the
+    number of IDs. Records (same shape as `get_expression_by_ids`) are
+    then built lazily, BULK_CHUNK_SIZE at a time.
+    Returns (record count, IDs not found, iterator of record chunks).
+    """
+
+    dataset = load_query_dataset(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+        columns=columns,
+    )
+
+    selected_rows, not_found_ids = select_rows(dataset, feature, ids)
+
+    def chunks() -> Iterator[list[dict]]:
+        for start in range(0, len(selected_rows), BULK_CHUNK_SIZE):
+            yield build_records(
+                dataset,
+                selected_rows[start:start + BULK_CHUNK_SIZE],
+                columns,
+            )
+
+    return len(selected_rows), not_found_ids, chunks()
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+from src.gene.repository.csv_repository import load_expression_dataset
+from src.gene.repository.expression_dataset import ExpressionDataset
+from src.gene.services.query_service import (
+    InvalidColumnsError,
+    load_query_dataset,
+)
+
+# Rows centered per step when computing row norms (bounds temporary memory)
+_STATS_CHUNK_ROWS = 65536
+
+
+def get_coexpressed(
+    organism: str,
+    data_type: str,
+    feature: str,
+    query_id: str,
+    columns: list[str] | None,
+    top: int,
+    method: str,
+) -> list[dict]:
+    """
+    Return the `top` transcripts most correlated with a query ID.
+    The ID may be a transcript (one profile) or a gene / miRNA (one
+    result per row it holds). Each result is a dictionary containing:
+    - "id_gen" / "id_transcript": The query row.
+    - "correlated": List of {"id_gen", "id_transcript", "r"}, highest r
+      first (ties in file order).
+
+    Profiles are compared over `columns` (all conditions if None) with
+    Pearson or Spearman correlation. Rows with missing values or a
+    constant profile are never returned (nor correlated, if they are the
+    query row); the query row itself is skipped.
+    An empty list means the ID was not found.
+    exceptions:
+        InvalidColumnsError: If a column is not a condition of the dataset.
+    """
+
+    if columns is None:
+        dataset = load_expression_dataset(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+        )
+        columns = dataset.conditions
+    else:
+        dataset = load_query_dataset(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            columns=columns,
+        )
+        invalid_cols = [c for c in columns if c not in dataset.conditions]
+        if invalid_cols:
+            raise InvalidColumnsError(
+                f"Invalid columns requested: {invalid_cols}")
+
+    rows = dataset.transcript_rows(query_id) if feature == "genes" else []
+    if not len(rows):
+        rows = dataset.gene_rows(query_id)
+
+    matrix = _profiles(dataset, columns, method)
+    norms = dataset.derived(
+        ("profile_norms", method, tuple(columns)),
+        lambda: _centered_norms(matrix),
+    )
+
+    return [
+        {
+            "id_gen": dataset.id_gen[row],
+            "id_transcript": dataset.id_transcript[row],
+            "correlated": _top_correlated(dataset, matrix, norms, row, top),
+        }
+        for row in rows
+    ]
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _profiles(
+    dataset: ExpressionDataset,
+    columns: list[str],
+    method: str,
+) -> np.ndarray:
+    # Profiles over `columns` (ranks for Spearman). Only the full rank
+    # matrix is kept with the dataset; column subsets are taken (and
+    # ranked) per request, so clients cannot pile up matrix copies
+    full = list(columns) == dataset.conditions
+    if method == "pearson":
+        return dataset.values if full else _column_block(dataset, columns)
+    if full:
+        return dataset.derived(("ranks",), lambda: _ranks(dataset.values))
+    return _ranks(_column_block(dataset, columns))
+
+
+def _column_block(
+    dataset: ExpressionDataset,
+    columns: list[str],
+) -> np.ndarray:
+    return np.asfortranarray(dataset.block(np.arange(len(dataset)), columns))
+
+
+def _ranks(matrix: np.ndarray) -> np.ndarray:
+    return np.asfortranarray(pd.DataFrame(matrix).rank(axis=1).to_numpy())
+
+
+def _centered_norms(matrix: np.ndarray) -> np.ndarray:
+    # Norm of each centered row, computed once per dataset version and
+    # column set (rows x 8 bytes). Rows with missing values or a constant
+    # profile get NaN
+    norms = np.empty(len(matrix), dtype=np.float64)
+    for start in range(0, len(matrix), _STATS_CHUNK_ROWS):
+        chunk = matrix[start:start + _STATS_CHUNK_ROWS]
+        centered = chunk - chunk.mean(axis=1, keepdims=True)
+        norms[start:start + len(chunk)] = np.sqrt(
+            np.einsum("ij,ij->i", centered, centered)
+        )
+    norms[~(norms > 0)] = np.nan  # constant profiles (and NaN rows)
+    return norms
+
+
+def _top_correlated(
+    dataset: ExpressionDataset,
+    matrix: np.ndarray,
+    norms: np.ndarray,
+    row: int,
+    top: int,
+) -> list[dict]:
+    if not np.isfinite(norms[row]):
+        return []
+
+    # With a centered query, X @ q equals the centered dot product, so one
+    # matrix-vector product gives every correlation
+    query = matrix[row] - matrix[row].mean()
+    scores = (matrix @ query) / (norms * norms[row])
+    scores[row] = np.nan
+
+    candidates = np.flatnonzero(np.isfinite(scores))
+    if len(candidates) > top:
+        # Keep every row tied with the last one, so ties resolve in order
+        cutoff = -np.partition(-scores[candidates], top - 1)[top - 1]
+        candidates = candidates[scores[candidates] >= cutoff]
+    order = np.lexsort((candidates, -scores[candidates]))
+    selected = candidates[order][:top]
+
+    return [
+        {"id_gen": gid, "id_transcript": tid, "r": r}
+        for gid, tid, r in zip(
+            dataset.id_gen[selected].tolist(),
+            dataset.id_transcript[selected].tolist(),
+            np.clip(scores[selected], -1.0, 1.0).tolist(),
+        )
+    ]
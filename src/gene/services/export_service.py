@@ -0,0 +1,108 @@
+import base64
+import binascii
+import json
+from typing import Iterator
+import numpy as np
+from src.gene.repository.csv_repository import load_expression_dataset
+from src.gene.services.query_service import build_records, load_query_dataset
+from src.gene.utils.validators import ValidationError
+
+# Records built (and serialized) per step of a streamed page
+EXPORT_CHUNK_SIZE = 500
+
+
+class InvalidCursorError(ValidationError):
+    pass
+
+
+def export_page(
+    organism: str,
+    data_type: str,
+    feature: str,
+    columns: list[str] | None,
+    cursor: str | None,
+    limit: int,
+) -> tuple[dict, Iterator[list[dict]]]:
+    """
+    Return one page of a full dataset export.
+    Rows are exported in file order. The cursor is opaque to clients and
+    encodes the dataset version and the next row offset, so pages stay
+    consistent for as long as that version is served; a cursor from
+    another version is rejected.
+    Returns (page info, iterator of record chunks). Page info holds:
+    - "dataset_version": Opaque dataset version token.
+    - "total": Number of rows in the dataset.
+    - "count": Number of records in this page.
+    - "columns": Exported condition columns.
+    - "next_cursor": Cursor of the next page, or None on the last page.
+    exceptions:
+        InvalidCursorError: If the cursor is malformed or stale.
+    """
+
+    if columns:
+        dataset = load_query_dataset(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            columns=columns,
+        )
+    else:
+        dataset = load_expression_dataset(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+        )
+        columns = dataset.conditions
+
+    offset = 0
+    if cursor:
+        version, offset = decode_cursor(cursor)
+        if version != dataset.version:
+            raise InvalidCursorError(
+                "Cursor belongs to another dataset version; "
+                "restart the export."
+            )
+
+    total = len(dataset)
+    start = min(offset, total)
+    end = min(start + limit, total)
+
+    info = {
+        "dataset_version": dataset.version,
+        "total": total,
+        "count": end - start,
+        "columns": list(columns),
+        "next_cursor": (
+            encode_cursor(dataset.version, end) if end < total else None
+        ),
+    }
+
+    def chunks() -> Iterator[list[dict]]:
+        for chunk_start in range(start, end, EXPORT_CHUNK_SIZE):
+            chunk_end = min(chunk_start + EXPORT_CHUNK_SIZE, end)
+            yield build_records(
+                dataset,
+                np.arange(chunk_start, chunk_end),
+                columns,
+            )
+
+    return info, chunks()
+
+
+def encode_cursor(version: str, offset: int) -> str:
+    payload = json.dumps({"v": version, "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        version, offset = payload["v"], payload["o"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Invalid cursor.")
+
+    if not isinstance(version, str) or not isinstance(offset, int) or offset < 0:
+        raise InvalidCursorError("Invalid cursor.")
+
+    return version, offset
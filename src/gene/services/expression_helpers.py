@@ -1,6 +1,157 @@
-# Function to safely convert a value to float, returning 0.0 on failure
-def safe_float(value) -> float:
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return 0.0
+import json
+from collections.abc import Sequence
+import numpy as np
+
+# safe_float lives in utils so datasets can be coerced at load time
+from src.gene.utils.numeric import safe_float  # noqa: F401
+from src.gene.utils.json_provider import float_json_rows
+
+
+class ExpressionColumns:
+    """
+    Condition names of a response, with the JSON text that opens each
+    `{"condition": ..., "value": ...}` object computed once.
+    """
+
+    def __init__(self, columns: list[str]):
+        self.names = list(columns)
+        self.prefixes = [
+            '{"condition":' + json.dumps(col) + ',"value":'
+            for col in self.names
+        ]
+
+
+class ExpressionList(Sequence):
+    """
+    The `expression` list of one record, backed by a row of floats.
+
+    It reads like a list of {"condition": col, "value": v} dicts, but the
+    JSON provider writes it straight from the pre-formatted values via
+    `__json__`, so no dict is created per cell. The text is the same as
+    serializing the dicts with `json.dumps`.
+    """
+
+    __slots__ = ("_columns", "_values", "_texts")
+
+    def __init__(
+        self,
+        columns: ExpressionColumns,
+        values: np.ndarray,
+        texts: list[str],
+    ):
+        self._columns = columns
+        self._values = values
+        self._texts = texts
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return {
+            "condition": self._columns.names[index],
+            "value": float(self._values[index]),
+        }
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, ExpressionList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __json__(self) -> str:
+        if not self._texts:
+            return "[]"
+        return "[" + "},".join(
+            prefix + text
+            for prefix, text in zip(self._columns.prefixes, self._texts)
+        ) + "}]"
+
+
+# Build the `expression` lists of a block (one list per row)
+def build_expression_rows(
+    columns: list[str],
+    block: np.ndarray,
+) -> list[ExpressionList]:
+    expression_columns = ExpressionColumns(columns)
+    return [
+        ExpressionList(expression_columns, row_values, row_texts)
+        for row_values, row_texts in zip(block, float_json_rows(block))
+    ]
+
+
+class ValueList(Sequence):
+    """
+    A flat `values` array of floats, written by the JSON provider from
+    its pre-formatted text via `__json__`.
+    """
+
+    __slots__ = ("_values", "_texts")
+
+    def __init__(self, values: np.ndarray, texts: list[str]):
+        self._values = values
+        self._texts = texts
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index):
+        return self._values.tolist()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, ValueList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._values.tolist())
+
+    def __json__(self) -> str:
+        return "[" + ",".join(self._texts) + "]"
+
+
+class ExpressionBlock:
+    """
+    Selected expression rows kept as one matrix, for the compact response
+    formats: the IDs of each row and a (rows x conditions) float block.
+    """
+
+    def __init__(
+        self,
+        conditions: list[str],
+        id_gen: list[str],
+        id_transcript: list[str],
+        values: np.ndarray,
+    ):
+        self.conditions = list(conditions)
+        self.id_gen = id_gen
+        self.id_transcript = id_transcript
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.id_gen)
+
+    def to_columnar(self) -> dict:
+        """
+        `{"conditions": [...], "rows": [{"id_gen", "id_transcript",
+        "values"}]}`, with the condition names sent once.
+        """
+        return {
+            "conditions": self.conditions,
+            "rows": [
+                {
+                    "id_gen": gid,
+                    "id_transcript": tid,
+                    "values": ValueList(row_values, row_texts),
+                }
+                for gid, tid, row_values, row_texts in zip(
+                    self.id_gen,
+                    self.id_transcript,
+                    self.values,
+                    float_json_rows(self.values),
+                )
+            ],
+        }
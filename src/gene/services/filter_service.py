@@ -0,0 +1,198 @@
+import numpy as np
+from src.config import Config
+from src.gene.repository.csv_repository import load_expression_dataset
+from src.gene.repository.expression_dataset import ExpressionDataset
+from src.gene.services.query_service import (
+    InvalidColumnsError,
+    build_records,
+    load_query_dataset,
+)
+
+# A sorted index drives the query only when its predicate keeps at most
+# this fraction of the rows; above it a full-column mask is cheaper
+_INDEX_MAX_FRACTION = 1 / 16
+
+
+def filter_expression(
+    organism: str,
+    data_type: str,
+    feature: str,
+    filters: list[dict],
+    combine: str,
+    columns: list[str] | None,
+    limit: int,
+) -> tuple[list[dict], int]:
+    """
+    Return the rows whose values match the filters, in file order.
+    Each filter is {"column", "op", "value"} with op one of:
+    - ">", ">=", "<", "<=": compare with a number.
+    - "between": low <= value <= high, with value [low, high].
+    - "abs>", "abs<": compare the absolute value with a number.
+    Filters are combined with `combine` ("and" / "or"). Missing values
+    never match.
+    Records have the same shape as `get_expression_by_ids`, over `columns`
+    (all conditions if None). At most `limit` records are built.
+    Returns (records, total number of matching rows).
+    exceptions:
+        InvalidColumnsError: If a column is not a condition of the dataset.
+    """
+
+    filter_columns = list(dict.fromkeys(f["column"] for f in filters))
+
+    if columns is None:
+        dataset = load_expression_dataset(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+        )
+        columns = dataset.conditions
+    else:
+        dataset = load_query_dataset(
+            organism=organism,
+            data_type=data_type,
+            feature=feature,
+            columns=list(dict.fromkeys([*columns, *filter_columns])),
+        )
+
+    invalid_cols = [c for c in filter_columns if c not in dataset.conditions]
+    if invalid_cols:
+        raise InvalidColumnsError(
+            f"Invalid filter columns requested: {invalid_cols}")
+
+    rows = match_rows(dataset, filters, combine)
+
+    return build_records(dataset, rows[:limit], columns), len(rows)
+
+
+def match_rows(
+    dataset: ExpressionDataset,
+    filters: list[dict],
+    combine: str,
+) -> np.ndarray:
+    """
+    Ascending positions of the rows matching the filters.
+
+    Each predicate is a vectorized comparison over one column. For an AND
+    (or a single predicate), a selective range predicate is first answered
+    from the column's sorted index, and the other predicates are only
+    evaluated on the rows it keeps.
+    """
+    if combine == "and" and Config.EXPDB_FILTER_INDEXES:
+        rows = _indexed_rows(dataset, filters)
+        if rows is not None:
+            return rows
+
+    mask = None
+    for predicate in filters:
+        matched = _matches(dataset.column_values(predicate["column"]), predicate)
+        if mask is None:
+            mask = matched
+        elif combine == "and":
+            mask &= matched
+        else:
+            mask |= matched
+    return np.flatnonzero(mask)
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _matches(values: np.ndarray, predicate: dict) -> np.ndarray:
+    # Comparisons with NaN are False, so missing values never match
+    op, value = predicate["op"], predicate["value"]
+    if op == ">":
+        return values > value
+    if op == ">=":
+        return values >= value
+    if op == "<":
+        return values < value
+    if op == "<=":
+        return values <= value
+    if op == "between":
+        low, high = value
+        return (values >= low) & (values <= high)
+    if op == "abs>":
+        return np.abs(values) > value
+    return np.abs(values) < value  # abs<
+
+
+def _indexed_rows(
+    dataset: ExpressionDataset,
+    filters: list[dict],
+) -> np.ndarray | None:
+    # Rows matching every filter, driven by the most selective sorted
+    # index; None when no predicate is selective enough
+    best = None
+    for position, predicate in enumerate(filters):
+        order, ranges = _index_ranges(dataset, predicate)
+        count = sum(high - low for low, high in ranges)
+        if best is None or count < best[0]:
+            best = (count, position, order, ranges)
+
+    count, position, order, ranges = best
+    if count > len(dataset) * _INDEX_MAX_FRACTION:
+        return None
+
+    rows = np.sort(np.concatenate(
+        [order[:0], *(order[low:high] for low, high in ranges)]
+    ).astype(np.intp, copy=False))
+
+    for other, predicate in enumerate(filters):
+        if other != position and len(rows):
+            values = dataset.column_values(predicate["column"])[rows]
+            rows = rows[_matches(values, predicate)]
+    return rows
+
+
+def _index_ranges(
+    dataset: ExpressionDataset,
+    predicate: dict,
+) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    # Row order of the column's sorted index and the [low, high) slices of
+    # it holding the matching values
+    order, ordered = _sorted_column(dataset, predicate["column"])
+    op, value = predicate["op"], predicate["value"]
+
+    def left(v):
+        return int(np.searchsorted(ordered, v, side="left"))
+
+    def right(v):
+        return int(np.searchsorted(ordered, v, side="right"))
+
+    end = len(ordered)
+    if op == ">":
+        ranges = [(right(value), end)]
+    elif op == ">=":
+        ranges = [(left(value), end)]
+    elif op == "<":
+        ranges = [(0, left(value))]
+    elif op == "<=":
+        ranges = [(0, right(value))]
+    elif op == "between":
+        ranges = [(left(value[0]), right(value[1]))]
+    elif op == "abs>":
+        ranges = (
+            [(0, left(-value)), (right(value), end)]
+            if value >= 0 else [(0, end)]
+        )
+    else:  # abs<
+        ranges = [(right(-value), left(value))] if value > 0 else []
+
+    return order, [(low, high) for low, high in ranges if high > low]
+
+
+def _sorted_column(
+    dataset: ExpressionDataset,
+    column: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    # (row positions in value order, sorted values), missing values
+    # excluded; built on first use and kept for the dataset version
+    def build() -> tuple[np.ndarray, np.ndarray]:
+        values = dataset.column_values(column)
+        order = np.argsort(values, kind="stable")
+        order = order[:np.count_nonzero(~np.isnan(values))]  # NaN sort last
+        index_type = np.int32 if len(values) < 2**31 else np.intp
+        return order.astype(index_type), values[order]
+
+    return dataset.derived(("sorted", column), build)
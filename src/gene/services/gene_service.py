@@ -1,5 +1,8 @@
-from src.gene.repository.csv_repository import load_expression_df
-from src.gene.services.expression_helpers import safe_float
+from src.gene.repository.csv_repository import load_expression_dataset
+from src.gene.services.expression_helpers import (
+    ExpressionBlock,
+    build_expression_rows,
+)
 
 
 def get_expression_by_gene_id(
@@ -18,37 +21,29 @@ def get_expression_by_gene_id(
         - "expression": List of expression values across conditions.
     """
 
-    df = load_expression_df(
+    dataset = load_expression_dataset(
         organism=organism,
         data_type=data_type,
         feature=feature,
     )
 
-    df_gene = df[df["id_gen"] == gene_id]
+    rows = dataset.gene_rows(gene_id)
 
-    if df_gene.empty:
+    if not len(rows):
         return []
 
-    expression_cols = [
-        c for c in df_gene.columns
-        if c not in {"id_gen", "id_transcript"}
-    ]
-
-    transcripts = []
+    expression_cols = dataset.conditions
 
-    for _, row in df_gene.iterrows():
-        expressions = [
-            {
-                "condition": col,
-                "value": safe_float(row[col])
-            }
-            for col in expression_cols
-        ]
+    expressions = build_expression_rows(expression_cols, dataset.values[rows])
+    transcript_ids = dataset.id_transcript[rows].tolist()
 
-        transcripts.append({
-            "id_transcript": row["id_transcript"],
-            "expression": expressions
-        })
+    transcripts = [
+        {
+            "id_transcript": tid,
+            "expression": expression
+        }
+        for tid, expression in zip(transcript_ids, expressions)
+    ]
 
     return [
         {
@@ -56,3 +51,30 @@ def get_expression_by_gene_id(
             "transcripts": transcripts
         }
     ]
+
+
+def get_expression_block_by_gene_id(
+    organism: str,
+    data_type: str,
+    feature: str,
+    gene_id: str,
+) -> ExpressionBlock:
+    """
+    Expression of every transcript of a gene as one ExpressionBlock
+    (for the compact response formats); empty if the gene is not found.
+    """
+
+    dataset = load_expression_dataset(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+    )
+
+    rows = dataset.gene_rows(gene_id)
+
+    return ExpressionBlock(
+        conditions=dataset.conditions,
+        id_gen=dataset.id_gen[rows].tolist(),
+        id_transcript=dataset.id_transcript[rows].tolist(),
+        values=dataset.values[rows],
+    )
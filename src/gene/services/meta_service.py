@@ -1,7 +1,12 @@
-from src.gene.repository.csv_repository import load_meta_df
+from src.gene.repository.csv_repository import load_meta_dataset
+from src.gene.utils.json_provider import RawJSON
 
 
-def get_meta(organism: str, feature: str) -> list[dict]:
+def get_meta(
+    organism: str,
+    feature: str,
+    filters: dict[str, list[str]] | None = None,
+) -> list[RawJSON]:
     """
     Return metadata records for a given organism and feature.
     Each record is a dictionary containing:
@@ -17,34 +22,18 @@ def get_meta(organism: str, feature: str) -> list[dict]:
         - "additional_info"
         - "reference"
         - "doi"
+
+    Records come pre-serialized (built once per dataset version). With
+    `filters` ({field: [values]}), only records matching every field (any
+    of its values, case-insensitive) are returned.
     """
 
-    df = load_meta_df(
+    meta = load_meta_dataset(
         organism=organism,
         feature=feature,
     )
 
-    df = df.astype(str).fillna("")
-
-    records = df.to_dict("records")
-
-    data = [
-        {
-            "library": r["library"],
-            "information": {
-                "organism": r["organism"],
-                "cultivar": r["cultivar"],
-                "genotype": r["genotype"],
-                "tissue_organ": r["tissue_organ"],
-                "treatment": r["treatment"],
-                "inocula": r["inocula"],
-                "time_post_treatment": r["time_post_treatment"],
-                "additional_info": r["additional_info"],
-                "reference": r["reference"],
-                "doi": r["doi"],
-            }
-        }
-        for r in records
-    ]
+    if not filters:
+        return list(meta.fragments)
 
-    return data
+    return [meta.fragments[pos] for pos in meta.select(filters)]
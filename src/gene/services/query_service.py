@@ -1,5 +1,13 @@
-from src.gene.repository.csv_repository import load_expression_df
-from src.gene.services.expression_helpers import safe_float
+from src.gene.repository.csv_repository import (
+    load_expression_dataset,
+    load_expression_header,
+    load_meta_dataset,
+)
+from src.gene.repository.expression_dataset import ExpressionDataset
+from src.gene.services.expression_helpers import (
+    ExpressionBlock,
+    build_expression_rows,
+)
 from src.gene.utils.validators import ValidationError
 
 class InvalidColumnsError(ValidationError):
@@ -21,22 +29,143 @@ def get_expression_by_ids(
     - "expression": List of expression values across conditions.
     """
 
-    df = load_expression_df(
+    dataset = load_query_dataset(
         organism=organism,
         data_type=data_type,
         feature=feature,
+        columns=columns,
     )
 
-    # Column validation
-    invalid_cols = [c for c in columns if c not in df.columns]
+    selected_rows, not_found_ids = select_rows(dataset, feature, ids)
+
+    data = build_records(dataset, selected_rows, columns)
+
+    return data, not_found_ids
+
+
+def get_expression_block_by_ids(
+    organism: str,
+    data_type: str,
+    feature: str,
+    ids: list[str],
+    columns: list[str],
+) -> tuple[ExpressionBlock, list[str]]:
+    """
+    Same lookup as `get_expression_by_ids`, returning the selected rows
+    as one ExpressionBlock (for the compact response formats).
+    Returns (block, IDs not found).
+    """
+
+    dataset = load_query_dataset(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+        columns=columns,
+    )
+
+    selected_rows, not_found_ids = select_rows(dataset, feature, ids)
+
+    return select_block(dataset, selected_rows, columns), not_found_ids
+
+
+def resolve_meta_columns(
+    organism: str,
+    data_type: str,
+    feature: str,
+    meta: dict[str, str | list[str]],
+) -> list[str]:
+    """
+    Resolve metadata filters ({field: value or [values]}) to the expression
+    columns of the matching libraries, in metadata order. Libraries with
+    no column in the expression dataset are skipped.
+    exceptions:
+        InvalidColumnsError: If no expression column matches.
+    """
+
+    filters = {
+        field: [values] if isinstance(values, str) else values
+        for field, values in meta.items()
+    }
+
+    meta_dataset = load_meta_dataset(organism=organism, feature=feature)
+
+    header = set(load_expression_header(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+    ))
+
+    columns = [
+        library
+        for library in meta_dataset.libraries_for(filters)
+        if library in header
+    ]
+    if not columns:
+        raise InvalidColumnsError(
+            "No expression columns match the metadata filters."
+        )
+
+    return columns
+
+
+def load_query_dataset(
+    organism: str,
+    data_type: str,
+    feature: str,
+    columns: list[str],
+) -> ExpressionDataset:
+    """
+    Validate the requested columns and load the dataset to query them.
+    exceptions:
+        InvalidColumnsError: If a column is not part of the dataset.
+    """
+
+    # Column validation (against the cached header, before any load)
+    header = set(load_expression_header(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+    ))
+    invalid_cols = [c for c in columns if c not in header]
+    if invalid_cols:
+        raise InvalidColumnsError(
+            f"Invalid columns requested: {invalid_cols}")
+
+    # Only the requested columns need to be loaded
+    dataset = load_expression_dataset(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+        columns=columns,
+    )
+
+    # The served version may predate the header while a new one swaps in
+    invalid_cols = [c for c in columns if c not in dataset.columns]
     if invalid_cols:
         raise InvalidColumnsError(
             f"Invalid columns requested: {invalid_cols}")
 
-    data = []
+    return dataset
+
+
+def select_rows(
+    dataset: ExpressionDataset,
+    feature: str,
+    ids: list[str],
+) -> tuple[list[int], list[str]]:
+    """
+    Resolve gene / transcript IDs to row positions, in response order.
+    For genes, a gene ID brings all its transcripts and a transcript ID
+    already brought by a gene is not repeated.
+    Returns (row positions, IDs not found).
+    """
+
+    selected_rows = [] # Row positions, in response order
     processed_transcripts = set()  # To avoid duplicates
     not_found_ids = [] # IDs not found
 
+    transcript_col = dataset.id_transcript
+
     if feature == "genes":
         # Separating genes and transcripts
         gene_ids = [i for i in ids if ".t" not in i]
@@ -44,49 +173,77 @@ def get_expression_by_ids(
 
         # Process genes (brings all their transcripts)
         for gene_id in gene_ids:
-            df_gene = df[df["id_gen"] == gene_id]
-            if df_gene.empty:
+            rows = dataset.gene_rows(gene_id)
+            if not len(rows):
                 not_found_ids.append(gene_id)
                 continue
-            for _, row in df_gene.iterrows():
-                tid = row["id_transcript"]
+            for row in rows:
+                tid = transcript_col[row]
                 if tid in processed_transcripts:
                     continue
                 processed_transcripts.add(tid)
-                data.append({
-                    "id_gen": row["id_gen"],
-                    "id_transcript": row["id_transcript"],
-                    "expression": [{"condition": col, "value": safe_float(row[col])} for col in columns]
-                })
+                selected_rows.append(row)
 
         # Process individual transcripts (if they were not included by a gene)
         for tid in transcript_ids:
             if tid in processed_transcripts:
                 continue
-            df_transcript = df[df["id_transcript"] == tid]
-            if df_transcript.empty:
+            rows = dataset.transcript_rows(tid)
+            if not len(rows):
                 not_found_ids.append(tid)
                 continue
-            for _, row in df_transcript.iterrows():
-                processed_transcripts.add(tid)
-                data.append({
-                    "id_gen": row["id_gen"],
-                    "id_transcript": row["id_transcript"],
-                    "expression": [{"condition": col, "value": safe_float(row[col])} for col in columns]
-                })
+            processed_transcripts.add(tid)
+            selected_rows.extend(rows)
 
     else:
         # mirna
         for identifier in ids:
-            df_mirna = df[df["id_gen"] == identifier]
-            if df_mirna.empty:
+            rows = dataset.gene_rows(identifier)
+            if not len(rows):
                 not_found_ids.append(identifier)
                 continue
-            for _, row in df_mirna.iterrows():
-                data.append({
-                    "id_gen": row["id_gen"],
-                    "id_transcript": row["id_transcript"],
-                    "expression": [{"condition": col, "value": safe_float(row[col])} for col in columns]
-                })
+            selected_rows.extend(rows)
 
-    return data, not_found_ids
+    return selected_rows, not_found_ids
+
+
+def build_records(
+    dataset: ExpressionDataset,
+    rows: list[int],
+    columns: list[str],
+) -> list[dict]:
+    """
+    Build `id_gen` / `id_transcript` / `expression` records for the given
+    row positions, taking the selected block once.
+    """
+    if not len(rows):
+        return []
+
+    expressions = build_expression_rows(columns, dataset.block(rows, columns))
+    gene_ids = dataset.id_gen[rows].tolist()
+    transcript_ids = dataset.id_transcript[rows].tolist()
+
+    return [
+        {
+            "id_gen": gid,
+            "id_transcript": tid,
+            "expression": expression
+        }
+        for gid, tid, expression in zip(gene_ids, transcript_ids, expressions)
+    ]
+
+
+def select_block(
+    dataset: ExpressionDataset,
+    rows: list[int],
+    columns: list[str],
+) -> ExpressionBlock:
+    """
+    IDs and values of the given row positions as an ExpressionBlock.
+    """
+    return ExpressionBlock(
+        conditions=columns,
+        id_gen=dataset.id_gen[rows].tolist(),
+        id_transcript=dataset.id_transcript[rows].tolist(),
+        values=dataset.block(rows, columns),
+    )
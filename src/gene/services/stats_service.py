@@ -0,0 +1,102 @@
+import math
+from src.gene.repository.csv_repository import load_expression_dataset
+from src.gene.repository.summary_stats import STAT_NAMES, summary_stats
+from src.gene.services.query_service import InvalidColumnsError, select_rows
+
+
+def get_condition_stats(
+    organism: str,
+    data_type: str,
+    feature: str,
+    columns: list[str] | None,
+) -> list[dict]:
+    """
+    Return summary statistics of each condition (library), over all rows.
+    Each item is a dictionary containing:
+    - "condition": Condition name.
+    - "count", "mean", "median", "min", "max", "std": Statistics of the
+      non-missing values (std with ddof=1); None where undefined, e.g.
+      for a condition without values.
+    Conditions follow `columns`, or dataset order if None.
+    exceptions:
+        InvalidColumnsError: If a column is not a condition of the dataset.
+    """
+
+    dataset = load_expression_dataset(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+    )
+
+    if columns is None:
+        columns = dataset.conditions
+    invalid_cols = [c for c in columns if c not in dataset.conditions]
+    if invalid_cols:
+        raise InvalidColumnsError(
+            f"Invalid columns requested: {invalid_cols}")
+
+    stats = summary_stats(dataset)
+    positions = [dataset.conditions.index(c) for c in columns]
+
+    return [
+        {"condition": column, **_stat_fields(values)}
+        for column, values in zip(
+            columns, stats.conditions[positions].tolist()
+        )
+    ]
+
+
+def get_row_stats(
+    organism: str,
+    data_type: str,
+    feature: str,
+    ids: list[str],
+) -> tuple[list[dict], list[str]]:
+    """
+    Return summary statistics of gene / transcript rows, across all
+    conditions. IDs resolve as in `get_expression_by_ids` (a gene brings
+    all its transcripts). Each item is a dictionary containing:
+    - "id_gen": Gene ID.
+    - "id_transcript": Transcript ID.
+    - "count", "mean", "median", "min", "max", "std": As for conditions.
+    Returns (items, IDs not found).
+    """
+
+    dataset = load_expression_dataset(
+        organism=organism,
+        data_type=data_type,
+        feature=feature,
+    )
+
+    rows, not_found_ids = select_rows(dataset, feature, ids)
+    if not rows:
+        return [], not_found_ids
+
+    stats = summary_stats(dataset)
+
+    data = [
+        {"id_gen": gid, "id_transcript": tid, **_stat_fields(values)}
+        for gid, tid, values in zip(
+            dataset.id_gen[rows].tolist(),
+            dataset.id_transcript[rows].tolist(),
+            stats.rows[rows].tolist(),
+        )
+    ]
+    return data, not_found_ids
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _stat_fields(values: list[float]) -> dict:
+    # The count is stored as a float next to the other statistics;
+    # undefined (NaN) or infinite statistics are reported as null
+    fields = dict(zip(STAT_NAMES, values))
+    count = int(fields["count"])
+    fields = {
+        name: value if math.isfinite(value) else None
+        for name, value in fields.items()
+    }
+    fields["count"] = count
+    return fields
@@ -0,0 +1,197 @@
+import os
+import threading
+import numpy as np
+
+# Sidecar files written next to `{organism}_{data_type}_{feature}_vN.csv`:
+#   ..._vN.values.npy  float64 matrix (rows x conditions), column-major
+#   ..._vN.ids.npz     id_gen / id_transcript / conditions arrays, plus the
+#                      (size, mtime) stamps of the source CSV and of the
+#                      values file written with them
+VALUES_SUFFIX = ".values.npy"
+IDS_SUFFIX = ".ids.npz"
+
+
+def binary_cache_paths(csv_path: str) -> tuple[str, str]:
+    """
+    Return the (values, ids) sidecar paths for a dataset CSV.
+    """
+    stem = csv_path[:-len(".csv")] if csv_path.endswith(".csv") else csv_path
+    return stem + VALUES_SUFFIX, stem + IDS_SUFFIX
+
+
+def source_stamp(csv_path: str) -> tuple[int, int]:
+    """
+    (size, mtime in ns) of a dataset CSV, as recorded in its sidecars.
+    Take it before parsing the CSV that is written to the sidecars.
+    """
+    stat = os.stat(csv_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def is_binary_cache_fresh(csv_path: str) -> bool:
+    """
+    True when both sidecars exist, were written from the CSV as it is now
+    (same size and mtime) and belong to the same write.
+    Sidecars without stamps (older format) are never fresh.
+    """
+    values_path, ids_path = binary_cache_paths(csv_path)
+    try:
+        csv_stamp, values_stamp = _read_stamps(ids_path)
+        return (
+            csv_stamp == source_stamp(csv_path)
+            and values_stamp == _file_stamp(values_path)
+        )
+    except Exception:
+        return False
+
+
+def read_binary_dataset(
+    csv_path: str,
+    mmap: bool = False,
+) -> tuple[np.ndarray, np.ndarray, list[str], np.ndarray]:
+    """
+    Read the sidecars of a dataset CSV.
+    Returns (id_gen, id_transcript, conditions, values).
+    With `mmap`, the values matrix is memory-mapped read-only instead of
+    read into memory: processes mapping the same file share its pages and
+    only the rows actually read are paged in.
+    exceptions:
+        IOError: If the sidecar files cannot be read, or do not come from
+            the same write of the current CSV.
+    """
+    values_path, ids_path = binary_cache_paths(csv_path)
+    try:
+        with np.load(ids_path, allow_pickle=False) as ids:
+            id_gen = _restore_ids(ids["id_gen"], ids["id_gen_missing"])
+            id_transcript = _restore_ids(
+                ids["id_transcript"], ids["id_transcript_missing"]
+            )
+            conditions = ids["conditions"].tolist()
+            csv_stamp = tuple(ids["csv_stamp"].tolist())
+            values_stamp = tuple(ids["values_stamp"].tolist())
+        values = np.load(
+            values_path,
+            mmap_mode="r" if mmap else None,
+            allow_pickle=False,
+        )
+        # Checked after loading: a values file replaced by another write
+        # in the meantime no longer matches the stamp of these IDs
+        consistent = (
+            csv_stamp == source_stamp(csv_path)
+            and values_stamp == _file_stamp(values_path)
+        )
+    except Exception as exc:
+        raise IOError(
+            "An error occurred while reading the dataset cache file."
+        ) from exc
+
+    if not consistent or values.shape != (len(id_gen), len(conditions)):
+        raise IOError("The dataset cache file is inconsistent.")
+
+    return id_gen, id_transcript, conditions, values
+
+
+def read_binary_header(csv_path: str) -> list[str]:
+    """
+    Read the condition column names from the sidecars of a dataset CSV.
+    exceptions:
+        IOError: If the sidecar files cannot be read.
+    """
+    _, ids_path = binary_cache_paths(csv_path)
+    try:
+        with np.load(ids_path, allow_pickle=False) as ids:
+            return ids["conditions"].tolist()
+    except Exception as exc:
+        raise IOError(
+            "An error occurred while reading the dataset cache file."
+        ) from exc
+
+
+def write_binary_dataset(
+    csv_path: str,
+    id_gen: np.ndarray,
+    id_transcript: np.ndarray,
+    conditions: list[str],
+    values: np.ndarray,
+    stamp: tuple[int, int],
+):
+    """
+    Write the sidecars of a dataset CSV.
+    `stamp` is the `source_stamp` of the CSV the data was parsed from.
+    Files are written under a temporary name and renamed into place, so
+    readers never see a partially written cache; the IDs file, renamed
+    last, records the stamp of its values file so a pair mixed by
+    concurrent writers is detected on read.
+    exceptions:
+        OSError: If the files cannot be written (e.g. read-only EXPDB).
+    """
+    values_path, ids_path = binary_cache_paths(csv_path)
+    gen, gen_missing = _pack_ids(id_gen)
+    transcript, transcript_missing = _pack_ids(id_transcript)
+
+    values_stamp = _atomic_write(
+        values_path,
+        lambda f: np.save(f, np.asfortranarray(values, dtype=np.float64)),
+    )
+    _atomic_write(
+        ids_path,
+        lambda f: np.savez(
+            f,
+            id_gen=gen,
+            id_gen_missing=gen_missing,
+            id_transcript=transcript,
+            id_transcript_missing=transcript_missing,
+            conditions=np.array(conditions, dtype=str),
+            csv_stamp=np.array(stamp, dtype=np.int64),
+            values_stamp=np.array(values_stamp, dtype=np.int64),
+        ),
+    )
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _pack_ids(ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Missing IDs (NaN in the CSV) are stored as "" plus a mask
+    missing = np.array([not isinstance(v, str) for v in ids], dtype=bool)
+    packed = np.array(
+        [v if isinstance(v, str) else "" for v in ids],
+        dtype=str,
+    )
+    return packed, missing
+
+
+def _restore_ids(packed: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    ids = packed.astype(object)
+    ids[missing] = np.nan
+    return ids
+
+
+def _read_stamps(ids_path: str) -> tuple[tuple, tuple]:
+    # (CSV stamp, values file stamp) recorded in an IDs sidecar
+    with np.load(ids_path, allow_pickle=False) as ids:
+        return (
+            tuple(ids["csv_stamp"].tolist()),
+            tuple(ids["values_stamp"].tolist()),
+        )
+
+
+def _file_stamp(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _atomic_write(path: str, write) -> tuple[int, int]:
+    # Returns the stamp of the written file (kept by the rename); the
+    # temporary name is unique per process and thread
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            write(f)
+        stamp = _file_stamp(tmp_path)
+        os.replace(tmp_path, path)
+        return stamp
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
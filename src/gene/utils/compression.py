@@ -0,0 +1,113 @@
+import gzip
+from flask import Response, request
+from werkzeug.datastructures import Accept
+from src.config import Config
+
+try:
+    import brotli
+except ImportError:  # optional dependency, enables `br`
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, enables `zstd`
+    zstandard = None
+
+
+# --------------------
+# ENCODERS
+# --------------------
+# Content-Encoding -> compress function, in server preference order
+ENCODERS = {
+    name: encode
+    for name, encode in (
+        ("br", brotli and (lambda data: brotli.compress(data, quality=5))),
+        ("zstd", zstandard and (
+            lambda data: zstandard.ZstdCompressor(level=3).compress(data)
+        )),
+        ("gzip", lambda data: gzip.compress(data, compresslevel=6, mtime=0)),
+    )
+    if encode is not None
+}
+
+# Media types worth compressing (binary float blocks barely shrink)
+COMPRESSIBLE_TYPES = {"application/json", "application/x-ndjson"}
+
+
+def is_compressible(mimetype: str) -> bool:
+    return (
+        mimetype in COMPRESSIBLE_TYPES
+        or mimetype.endswith("+json")
+        or mimetype.startswith("text/")
+    )
+
+
+def choose_encoding(accept_encodings: Accept) -> str | None:
+    """
+    Best Content-Encoding the client accepts (highest q, then server
+    preference), or None to send the body as is.
+    """
+    best, best_quality = None, 0
+    for name in ENCODERS:
+        quality = accept_encodings[name]
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    return ENCODERS[encoding](data)
+
+
+def encoded_response(response: Response, encoding: str, data: bytes) -> Response:
+    """
+    Swap the body of `response` for its `encoding` representation.
+    The ETag is made weak, since the bytes differ from the identity body
+    but still match it for If-None-Match.
+    """
+    response.set_data(data)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+# --------------------
+# APP HOOK
+# --------------------
+def response_encoding(response: Response) -> str | None:
+    """
+    Content-Encoding to apply to `response`, or None to send it as is.
+    Buffered 200 responses of a compressible type and at least
+    EXPDB_COMPRESSION_MIN_SIZE bytes get the best encoding the client
+    accepts; streamed responses are sent as they are.
+    """
+    if not Config.EXPDB_COMPRESSION or not is_compressible(response.mimetype):
+        return None
+
+    response.vary.add("Accept-Encoding")
+
+    if (
+        response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.content_length is None
+        or response.content_length < Config.EXPDB_COMPRESSION_MIN_SIZE
+    ):
+        return None
+
+    return choose_encoding(request.accept_encodings)
+
+
+def compress_response(response: Response) -> Response:
+    """
+    after_request hook compressing responses (see `response_encoding`).
+    """
+    encoding = response_encoding(response)
+    if encoding is None:
+        return response
+    return encoded_response(
+        response, encoding, compress(response.get_data(), encoding)
+    )
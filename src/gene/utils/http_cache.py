@@ -0,0 +1,48 @@
+import hashlib
+from datetime import datetime
+from flask import Response, request
+from werkzeug.http import is_resource_modified
+from src.config import Config
+
+
+def make_etag(version: str, *parts: str) -> str:
+    """
+    ETag of a response built from a dataset `version`, for the request
+    `parts` that shape its body (endpoint, IDs, output format...).
+    """
+    digest = hashlib.sha1(
+        "\x1f".join((version, *parts)).encode()
+    ).hexdigest()
+    return digest[:32]
+
+
+def is_not_modified(etag: str, last_modified: datetime) -> bool:
+    """
+    True if the request's If-None-Match / If-Modified-Since headers show
+    the client already holds this response.
+    """
+    return not is_resource_modified(
+        request.environ, etag=etag, last_modified=last_modified
+    )
+
+
+def not_modified_response(etag: str, last_modified: datetime) -> Response:
+    """
+    Empty 304 response carrying the same validators as the full one.
+    """
+    return add_validators(Response(status=304), etag, last_modified)
+
+
+def add_validators(
+    response: Response,
+    etag: str,
+    last_modified: datetime,
+) -> Response:
+    """
+    Set ETag, Last-Modified and the configured Cache-Control.
+    """
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    if Config.EXPDB_CACHE_CONTROL:
+        response.headers["Cache-Control"] = Config.EXPDB_CACHE_CONTROL
+    return response
@@ -0,0 +1,217 @@
+import json
+import math
+import re
+import secrets
+from typing import Any
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional dependency, stdlib json is used instead
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson when it is installed (and enabled),
+    falling back to the stdlib encoder otherwise.
+
+    Objects exposing `__json__()` (e.g. expression rows) are embedded as
+    the pre-serialized JSON text they return, so large float blocks never
+    have to be expanded into one dict per cell.
+
+    Output is byte-for-byte what Flask's default provider writes: sorted
+    keys, compact separators, \\u escapes for non-ASCII text (unless
+    ensure_ascii is off), NaN / Infinity for non-finite floats (orjson
+    writes null) and repr() spelling for floats in exponent notation.
+    """
+
+    use_orjson = orjson is not None
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        fragments: list[str] = []
+        nonce = secrets.token_hex(8)
+
+        def default(o: Any) -> Any:
+            if hasattr(o, "__json__"):
+                fragments.append(o.__json__())
+                return f"\x00{nonce}:{len(fragments) - 1}\x00"
+            return self.default(o)
+
+        # orjson has no indentation control beyond 2 spaces; debug-mode
+        # pretty printing keeps using the stdlib encoder
+        text = None
+        if self.use_orjson and not kwargs.get("indent"):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                text = orjson.dumps(
+                    _respell_floats(obj), default=default, option=option
+                ).decode()
+            except TypeError:
+                # e.g. integers beyond 64 bits, which only json.dumps
+                # writes; start over there
+                fragments.clear()
+            else:
+                if kwargs.get("ensure_ascii", self.ensure_ascii):
+                    text = _escape_non_ascii(text)
+
+        if text is None:
+            kwargs["default"] = default
+            kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+            kwargs.setdefault("sort_keys", self.sort_keys)
+            text = json.dumps(obj, **kwargs)
+
+        if not fragments:
+            return text
+
+        # Both encoders escape NUL as \u0000; swap placeholders for text
+        return re.sub(
+            rf'"\\u0000{nonce}:(\d+)\\u0000"',
+            lambda m: fragments[int(m.group(1))],
+            text,
+        )
+
+
+class RawJSON:
+    """
+    Already serialized JSON text, embedded as is by FastJSONProvider.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __json__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.text!r})"
+
+
+def float_json_rows(block: np.ndarray) -> list[list[str]]:
+    """
+    JSON text of every value of a float matrix, row by row, spelled
+    exactly as `json.dumps` spells each float (repr, NaN, Infinity).
+
+    With orjson, rows whose values all lie in the range where orjson and
+    repr() agree on notation are formatted in a single call; other rows
+    go through repr().
+    """
+    texts: list[list[str] | None] = [None] * len(block)
+
+    if _ORJSON_FLOATS and block.size:
+        magnitude = np.abs(block)
+        plain = (magnitude == 0) | (
+            (magnitude >= _PLAIN_MIN) & (magnitude < _PLAIN_MAX)
+        )
+        plain_rows = np.flatnonzero(plain.all(axis=1))
+        if len(plain_rows):
+            text = orjson.dumps(
+                np.ascontiguousarray(block[plain_rows]),
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            ).decode()
+            for row, row_text in zip(plain_rows, text[2:-2].split("],[")):
+                texts[row] = row_text.split(",")
+
+    for row, row_texts in enumerate(texts):
+        if row_texts is None:
+            texts[row] = [float_json(value) for value in block[row].tolist()]
+
+    return texts
+
+
+def float_json(value: float) -> str:
+    """
+    JSON text of one float, as `json.dumps` writes it.
+    """
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+# Characters json.dumps escapes with ensure_ascii that orjson writes raw
+# (orjson only emits them inside strings)
+_NON_ASCII = re.compile(r"[^\x00-\x7e]")
+
+
+def _escape_non_ascii(text: str) -> str:
+    if text.isascii() and "\x7f" not in text:
+        return text
+    return _NON_ASCII.sub(_escape_char, text)
+
+
+def _escape_char(match: re.Match) -> str:
+    # \uXXXX as json.dumps writes it, as a surrogate pair above the BMP
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}"
+
+
+def _respell_floats(obj: Any) -> Any:
+    # `obj` with the floats orjson spells differently from json.dumps
+    # (non-finite, exponent notation) pre-serialized; containers are only
+    # copied when something inside them changes
+    if isinstance(obj, float):
+        return obj if _orjson_spells(obj) else RawJSON(float_json(obj))
+    if isinstance(obj, np.floating):
+        return obj if math.isfinite(obj) else RawJSON(float_json(obj))
+    if isinstance(obj, dict):
+        changed = None
+        for key, value in obj.items():
+            spelled = _respell_floats(value)
+            if spelled is not value:
+                changed = changed or dict(obj)
+                changed[key] = spelled
+        return obj if changed is None else changed
+    if isinstance(obj, (list, tuple)):
+        changed = None
+        for pos, value in enumerate(obj):
+            spelled = _respell_floats(value)
+            if spelled is not value:
+                changed = changed or list(obj)
+                changed[pos] = spelled
+        return obj if changed is None else changed
+    if isinstance(obj, np.ndarray) and obj.dtype == np.float64:
+        return _respell_floats(obj.tolist())
+    return obj
+
+
+def _orjson_spells(value: float) -> bool:
+    # orjson writes `value` exactly as repr() does
+    return _ORJSON_FLOATS and (
+        value == 0 or _PLAIN_MIN <= abs(value) < _PLAIN_MAX
+    )
+
+
+# Magnitudes written without an exponent by both orjson and repr()
+_PLAIN_MIN = 1e-4
+_PLAIN_MAX = 1e16
+
+
+def _orjson_floats_match() -> bool:
+    # Guard against an orjson release that spells floats differently
+    if orjson is None:
+        return False
+    probe = np.array([
+        0.0, -0.0, 1e-4, -2.5e-4, 0.1, 1 / 3, 37.0,
+        123456789012345.6, 9999999999999998.0,
+    ])
+    text = orjson.dumps(probe, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return text[1:-1].split(",") == [repr(v) for v in probe.tolist()]
+
+
+_ORJSON_FLOATS = _orjson_floats_match()
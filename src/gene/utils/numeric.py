@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+
+# Function to safely convert a value to float, returning 0.0 on failure
+def safe_float(value) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+# Convert a block of cells to a float matrix with `safe_float` semantics.
+# Clean columns are cast in one pass (numpy applies float() per cell in C);
+# only columns holding non-numeric text fall back to safe_float.
+def to_float_array(block: pd.DataFrame | np.ndarray) -> np.ndarray:
+    values = np.asarray(block, dtype=object)
+    if values.ndim == 1:
+        return _to_float_column(values)
+    try:
+        return values.astype(np.float64)
+    except (ValueError, TypeError):
+        pass
+
+    result = np.empty(values.shape, dtype=np.float64)
+    for j in range(values.shape[1]):
+        result[:, j] = _to_float_column(values[:, j])
+    return result
+
+
+# Convert a parsed CSV column to float64 with `safe_float` semantics
+def to_float_series(column: pd.Series) -> np.ndarray:
+    if pd.api.types.is_bool_dtype(column):
+        # Only "True"/"False" tokens parse as bool; float() rejects them
+        return np.zeros(len(column), dtype=np.float64)
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.float64)
+    return _to_float_column(column.to_numpy(dtype=object))
+
+
+def _to_float_column(column: np.ndarray) -> np.ndarray:
+    try:
+        return column.astype(np.float64)
+    except (ValueError, TypeError):
+        return np.fromiter(
+            (safe_float(v) for v in column),
+            dtype=np.float64,
+            count=len(column),
+        )
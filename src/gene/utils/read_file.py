@@ -10,10 +10,7 @@ def read_dataset(file_path: str) -> pd.DataFrame:
         IOError: If there is an error reading the file.
     """
 
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(
-            "The requested dataset file does not exist."
-        )
+    _check_exists(file_path)
 
     try:
         return pd.read_csv(file_path, dtype=str)
@@ -21,3 +18,56 @@ def read_dataset(file_path: str) -> pd.DataFrame:
         raise IOError(
             "An error occurred while reading the dataset file."
         ) from exc
+
+
+def read_dataset_header(file_path: str) -> list[str]:
+    """
+    Read only the header row of a CSV dataset.
+    exceptions:
+        FileNotFoundError: If the file does not exist.
+        IOError: If there is an error reading the file.
+    """
+
+    _check_exists(file_path)
+
+    try:
+        return pd.read_csv(file_path, nrows=0).columns.tolist()
+    except Exception as exc:
+        raise IOError(
+            "An error occurred while reading the dataset file."
+        ) from exc
+
+
+def read_expression_dataset(
+    file_path: str,
+    id_columns: list[str],
+) -> pd.DataFrame:
+    """
+    Read an expression CSV keeping ID columns as strings and letting
+    every other column parse as a number.
+    Values are parsed with round-trip precision, so each number is the
+    same float that float() gives for its text.
+    exceptions:
+        FileNotFoundError: If the file does not exist.
+        IOError: If there is an error reading the file.
+    """
+
+    _check_exists(file_path)
+
+    try:
+        return pd.read_csv(
+            file_path,
+            dtype={col: str for col in id_columns},
+            float_precision="round_trip",
+        )
+    except Exception as exc:
+        raise IOError(
+            "An error occurred while reading the dataset file."
+        ) from exc
+
+
+def _check_exists(file_path: str):
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(
+            "The requested dataset file does not exist."
+        )
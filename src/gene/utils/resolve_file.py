@@ -1,7 +1,24 @@
 import os
 import re
+import threading
+import time
 from src.config import Config
 
+# --------------------
+# CATALOG
+# --------------------
+# organism -> {
+#   "folder": organism folder path (EXPDB_PATH may change in tests),
+#   "checked_at": monotonic time of the last freshness check,
+#   "mtime": organism folder mtime when it was scanned,
+#   "datasets": {(data_type, feature): [(version, fname), ...]},
+# }
+# Within Config.EXPDB_CATALOG_TTL seconds a lookup is a dict access.
+# After that the folder is stat'ed and only re-listed if its mtime
+# changed, which is how a newly dropped `_vN+1.csv` gets picked up.
+_catalog: dict[str, dict] = {}
+_catalog_lock = threading.Lock()
+
 
 def resolve_dataset_file(
     organism: str,
@@ -27,28 +44,142 @@ def resolve_dataset_file(
 
     folder = os.path.join(Config.EXPDB_PATH, organism)
 
-    if not os.path.isdir(folder):
+    datasets = _organism_datasets(organism, folder)
+
+    if datasets is None:
         raise FileNotFoundError(
             f"Organism folder not found: {organism}"
         )
 
+    candidates = datasets.get((data_type, feature))
+
+    if not candidates:
+        raise FileNotFoundError(
+            "Dataset file not found for the given parameters."
+        )
+
+    # Select highest version
+    latest_file = candidates[-1][1]
+    return os.path.join(folder, latest_file)
+
+
+def iter_dataset_files(
+    organism: str | None = None,
+) -> list[tuple[str, str, str, int, str]]:
+    """
+    List every versioned dataset file under EXPDB_PATH.
+
+    Returns tuples of (organism, data_type, feature, version, path).
+    If `organism` is given, only that organism folder is scanned.
+    """
+
+    if organism is not None:
+        organisms = [organism.lower()]
+    elif os.path.isdir(Config.EXPDB_PATH):
+        organisms = sorted(os.listdir(Config.EXPDB_PATH))
+    else:
+        organisms = []
+
+    datasets: list[tuple[str, str, str, int, str]] = []
+
+    for org in organisms:
+        folder = os.path.join(Config.EXPDB_PATH, org)
+        found = _organism_datasets(org, folder)
+        if not found:
+            continue
+
+        for (data_type, feature), versions in sorted(found.items()):
+            for version, fname in versions:
+                datasets.append((
+                    org,
+                    data_type,
+                    feature,
+                    version,
+                    os.path.join(folder, fname),
+                ))
+
+    return datasets
+
+
+def clear_catalog():
+    """
+    Forget every scanned organism folder.
+    """
+    with _catalog_lock:
+        _catalog.clear()
+
+
+# --------------------
+# INTERNAL HELPERS
+# --------------------
+
+def _organism_datasets(
+    organism: str,
+    folder: str,
+) -> dict[tuple[str, str], list[tuple[int, str]]] | None:
+    # Catalog entry of an organism folder, or None if it does not exist
+    now = time.monotonic()
+
+    with _catalog_lock:
+        entry = _catalog.get(organism)
+        if (
+            entry is not None
+            and entry["folder"] == folder
+            and now - entry["checked_at"] < Config.EXPDB_CATALOG_TTL
+        ):
+            return entry["datasets"]
+
+    try:
+        mtime = os.stat(folder).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        with _catalog_lock:
+            _catalog.pop(organism, None)
+        return None
+
+    if not os.path.isdir(folder):
+        return None
+
+    unchanged = (
+        entry is not None
+        and entry["folder"] == folder
+        and entry["mtime"] == mtime
+    )
+    if unchanged:
+        datasets = entry["datasets"]
+    else:
+        datasets = _scan_folder(organism, folder)
+
+    with _catalog_lock:
+        _catalog[organism] = {
+            "folder": folder,
+            "checked_at": now,
+            "mtime": mtime,
+            "datasets": datasets,
+        }
+
+    return datasets
+
+
+def _scan_folder(
+    organism: str,
+    folder: str,
+) -> dict[tuple[str, str], list[tuple[int, str]]]:
+    # (data_type, feature) -> versions sorted ascending
     pattern = re.compile(
-        rf"{organism}_{data_type}_{feature}_v(\d+)\.csv"
+        rf"{re.escape(organism)}_([^_]+)_([^_]+)_v(\d+)\.csv"
     )
 
-    candidates: list[tuple[int, str]] = []
+    datasets: dict[tuple[str, str], list[tuple[int, str]]] = {}
 
     for fname in os.listdir(folder):
         match = pattern.fullmatch(fname)
         if match:
-            version = int(match.group(1))
-            candidates.append((version, fname))
+            data_type, feature, version = match.groups()
+            datasets.setdefault((data_type, feature), []).append(
+                (int(version), fname)
+            )
 
-    if not candidates:
-        raise FileNotFoundError(
-            "Dataset file not found for the given parameters."
-        )
+    for versions in datasets.values():
+        versions.sort()
 
-    # Select highest version
-    latest_file = max(candidates, key=lambda x: x[0])[1]
-    return os.path.join(folder, latest_file)
\ No newline at end of file
+    return datasets
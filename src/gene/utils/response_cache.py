@@ -0,0 +1,150 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+
+class ResponseCache:
+    """
+    Process-wide LRU cache of serialized response bodies, bounded by the
+    total size of the bodies it holds.
+
+    Entries are stored per dataset (`dataset` key) and dataset version.
+    Storing a body for a new version of a dataset drops every entry of its
+    older versions, and bodies larger than 1/8 of the capacity are not
+    kept. A `max_bytes` of 0 disables the cache.
+
+    Compressed representations of a body (gzip, br...) are kept on its
+    entry and count towards its size.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max(0, max_bytes)
+        self._entries: OrderedDict[
+            tuple[Hashable, str, Hashable], CachedResponse
+        ] = OrderedDict()
+        self._versions: dict[Hashable, str] = {}  # dataset -> latest version
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def get(
+        self,
+        dataset: Hashable,
+        version: str,
+        request_key: Hashable,
+    ) -> "CachedResponse | None":
+        """
+        Return the cached response of a request, or None.
+        """
+        if not self.max_bytes:
+            return None
+        key = (dataset, version, request_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry
+
+    def put(
+        self,
+        dataset: Hashable,
+        version: str,
+        request_key: Hashable,
+        content_type: str,
+        body: bytes,
+    ):
+        """
+        Store the serialized body of a request for a dataset version.
+        """
+        if not self.max_bytes or len(body) > self.max_bytes // 8:
+            return
+        key = (dataset, version, request_key)
+        with self._lock:
+            if self._versions.get(dataset) != version:
+                self._drop_dataset(dataset)
+                self._versions[dataset] = version
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = CachedResponse(content_type, body)
+            self._bytes += len(body)
+            self._evict()
+
+    def put_encoded(
+        self,
+        dataset: Hashable,
+        version: str,
+        request_key: Hashable,
+        encoding: str,
+        data: bytes,
+    ):
+        """
+        Keep the `encoding` representation of a cached body, if the body
+        is still cached.
+        """
+        key = (dataset, version, request_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or encoding in entry.encoded:
+                return
+            entry.encoded[encoding] = data
+            self._bytes += len(data)
+            self._evict()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._bytes = 0
+
+    # --------------------
+    # INTERNAL HELPERS
+    # --------------------
+
+    def _drop_dataset(self, dataset: Hashable):
+        # Called with the lock held; drops the entries of older versions
+        stale = [key for key in self._entries if key[0] == dataset]
+        for key in stale:
+            self._bytes -= self._entries.pop(key).size
+        self._stats["invalidations"] += len(stale)
+
+    def _evict(self):
+        # Called with the lock held
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._stats["evictions"] += 1
+
+
+class CachedResponse:
+    """
+    A serialized response body and its compressed representations.
+    """
+
+    __slots__ = ("content_type", "body", "encoded")
+
+    def __init__(self, content_type: str, body: bytes):
+        self.content_type = content_type
+        self.body = body
+        self.encoded: dict[str, bytes] = {}  # Content-Encoding -> bytes
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(d) for d in self.encoded.values())
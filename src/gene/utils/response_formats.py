@@ -0,0 +1,133 @@
+import json
+import struct
+import numpy as np
+from werkzeug.datastructures import MIMEAccept
+from src.gene.constants import EXPRESSION_FORMATS
+from src.gene.utils.validators import ValidationError
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # optional dependency, only needed for Arrow output
+    pyarrow = None
+
+
+# --------------------
+# EXCEPTIONS
+# --------------------
+class UnsupportedFormatError(ValidationError):
+    pass
+
+
+# --------------------
+# FORMAT NEGOTIATION
+# --------------------
+def resolve_expression_format(
+    format_arg: str | None,
+    accept: MIMEAccept,
+) -> str:
+    """
+    Pick the expression response format.
+
+    `?format=` wins over the Accept header. Without either, or when the
+    Accept header matches none of EXPRESSION_FORMATS, the original
+    `records` format is used.
+
+    exceptions:
+        ValidationError: If `format` is not a known format.
+        UnsupportedFormatError: If the format needs a missing dependency.
+    """
+    if format_arg:
+        output_format = format_arg.lower()
+        if output_format not in EXPRESSION_FORMATS:
+            raise ValidationError(
+                f"Invalid format. Expected one of {set(EXPRESSION_FORMATS)}."
+            )
+    else:
+        media_type = accept.best_match(
+            list(EXPRESSION_FORMATS.values()),
+            default=EXPRESSION_FORMATS["records"],
+        )
+        output_format = next(
+            name for name, mt in EXPRESSION_FORMATS.items()
+            if mt == media_type
+        )
+
+    if output_format == "arrow" and pyarrow is None:
+        raise UnsupportedFormatError(
+            "Arrow output is not available on this server (pyarrow is not installed)."
+        )
+
+    return output_format
+
+
+# --------------------
+# BINARY ENCODERS
+# --------------------
+def float32_body(
+    header: dict,
+    conditions: list[str],
+    id_gen: list[str],
+    id_transcript: list[str],
+    values: np.ndarray,
+) -> bytes:
+    """
+    Raw float32 response:
+
+        uint32 LE   length of the JSON header in bytes
+        bytes       JSON header (UTF-8), space-padded so the values start
+                    at a multiple of 8 bytes
+        float32 LE  values, row-major (rows x conditions)
+
+    The header holds the envelope fields plus `conditions`, `id_gen`,
+    `id_transcript`, `shape` and `dtype`. Values are rounded to float32.
+    """
+    header = {
+        **header,
+        "conditions": conditions,
+        "id_gen": id_gen,
+        "id_transcript": id_transcript,
+        "shape": list(values.shape),
+        "dtype": "<f4",
+    }
+    text = json.dumps(header, separators=(",", ":"), sort_keys=True).encode()
+    text += b" " * (-(4 + len(text)) % 8)
+    matrix = np.ascontiguousarray(values, dtype="<f4")
+    return struct.pack("<I", len(text)) + text + matrix.tobytes()
+
+
+def arrow_body(
+    header: dict,
+    conditions: list[str],
+    id_gen: list[str],
+    id_transcript: list[str],
+    values: np.ndarray,
+) -> bytes:
+    """
+    Arrow IPC stream with one record batch: `id_gen`, `id_transcript` and
+    one float64 column per condition. The envelope fields are stored as
+    JSON in the `expdb` schema metadata.
+    """
+    arrays = [
+        pyarrow.array(id_gen, type=pyarrow.string()),
+        pyarrow.array(id_transcript, type=pyarrow.string()),
+        *(
+            pyarrow.array(np.ascontiguousarray(values[:, pos]))
+            for pos in range(len(conditions))
+        ),
+    ]
+    schema = pyarrow.schema(
+        [
+            pyarrow.field(name, array.type)
+            for name, array in zip(
+                ["id_gen", "id_transcript", *conditions], arrays
+            )
+        ],
+        metadata={"expdb": json.dumps(header, sort_keys=True)},
+    )
+    batch = pyarrow.record_batch(arrays, schema=schema)
+
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
@@ -1,3 +1,6 @@
+import math
+from src.gene.constants import REQUIRED_META_COLUMNS
+
 # --------------------
 # EXCEPTIONS
 # --------------------
@@ -64,10 +67,12 @@ def validate_expression_query_request(
     data_type: str,
     feature: str,
     ids: list[str],
-    columns: list[str]
+    columns: list[str],
+    meta: dict | None = None,
 ):
     """
     Validates the input for querying multiple expressions by IDs and columns.
+    Columns may instead be selected with metadata filters (`meta`).
     """
     if not organism or not isinstance(organism, str):
         raise ValidationError("Organism is required.")
@@ -93,6 +98,12 @@ def validate_expression_query_request(
             f"Maximum allowed IDs per request is {MAX_IDS}."
         )
 
+    if meta is not None:
+        if columns:
+            raise ValidationError("Provide either columns or meta, not both.")
+        validate_meta_filters(meta)
+        return
+
     if not columns or not isinstance(columns, list):
         raise ValidationError("columns must be a non-empty list of strings.")
 
@@ -100,3 +111,465 @@ def validate_expression_query_request(
         raise ValidationError("All columns must be strings.")
 
 
+def validate_meta_filters(meta: dict):
+    """
+    Validates metadata filters: {field: value or [values]} over the
+    metadata columns.
+    """
+    if not meta or not isinstance(meta, dict):
+        raise ValidationError(
+            "meta must be a non-empty object of metadata filters."
+        )
+
+    invalid_fields = [f for f in meta if f not in REQUIRED_META_COLUMNS]
+    if invalid_fields:
+        raise ValidationError(
+            f"Invalid meta fields: {invalid_fields}. Expected any of {REQUIRED_META_COLUMNS}."
+        )
+
+    for field, values in meta.items():
+        if isinstance(values, str):
+            values = [values]
+        if (
+            not values
+            or not isinstance(values, list)
+            or not all(isinstance(v, str) for v in values)
+        ):
+            raise ValidationError(
+                f"meta.{field} must be a string or a non-empty list of strings."
+            )
+
+
+# --------------------
+# BULK IDS QUERY VALIDATION
+# --------------------
+MAX_BULK_IDS = 50000
+
+def validate_bulk_query_request(
+    organism: str,
+    data_type: str,
+    feature: str,
+    ids: list[str],
+    columns: list[str]
+):
+    """
+    Validates the input for a streamed bulk query (up to MAX_BULK_IDS IDs).
+    """
+    if not organism or not isinstance(organism, str):
+        raise ValidationError("Organism is required.")
+
+    if data_type not in ALLOWED_DATA_TYPES:
+        raise ValidationError(
+            f"Invalid data_type. Expected one of {ALLOWED_DATA_TYPES}."
+        )
+
+    if feature not in ALLOWED_FEATURES:
+        raise ValidationError(
+            f"Invalid feature. Expected one of {ALLOWED_FEATURES}."
+        )
+
+    if not ids or not isinstance(ids, list):
+        raise ValidationError("ids must be a non-empty list of strings.")
+
+    if not all(isinstance(g, str) for g in ids):
+        raise ValidationError("All ids must be strings.")
+
+    if len(ids) > MAX_BULK_IDS:
+        raise IdsLimitExceededError(
+            f"Maximum allowed IDs per bulk request is {MAX_BULK_IDS}."
+        )
+
+    if not columns or not isinstance(columns, list):
+        raise ValidationError("columns must be a non-empty list of strings.")
+
+    if not all(isinstance(c, str) for c in columns):
+        raise ValidationError("All columns must be strings.")
+
+
+# --------------------
+# EXPORT VALIDATION
+# --------------------
+DEFAULT_EXPORT_PAGE_SIZE = 1000
+MAX_EXPORT_PAGE_SIZE = 10000
+
+def validate_export_request(
+    organism: str,
+    data_type: str,
+    feature: str,
+    limit: str,
+    columns: list[str] | None
+):
+    """
+    Validates the input for a paginated dataset export.
+    `limit` is the raw page size from the query string.
+    """
+    if not organism or not isinstance(organism, str):
+        raise ValidationError("Organism is required.")
+
+    if data_type not in ALLOWED_DATA_TYPES:
+        raise ValidationError(
+            f"Invalid data_type. Expected one of {ALLOWED_DATA_TYPES}."
+        )
+
+    if feature not in ALLOWED_FEATURES:
+        raise ValidationError(
+            f"Invalid feature. Expected one of {ALLOWED_FEATURES}."
+        )
+
+    if not _is_count(limit, MAX_EXPORT_PAGE_SIZE):
+        raise ValidationError(
+            f"limit must be an integer between 1 and {MAX_EXPORT_PAGE_SIZE}."
+        )
+
+    if columns is not None and not all(isinstance(c, str) for c in columns):
+        raise ValidationError("All columns must be strings.")
+
+
+def _is_count(value, maximum: int) -> bool:
+    # ASCII decimal integer between 1 and `maximum`; str.isdigit alone
+    # also accepts digits such as "²" that int() rejects
+    text = str(value)
+    if not text.isascii() or not text.isdigit():
+        return False
+    try:
+        return 1 <= int(text) <= maximum
+    except ValueError:
+        # Past the interpreter's limit on integer string length
+        return False
+
+
+# --------------------
+# CO-EXPRESSION VALIDATION
+# --------------------
+COEXPRESSION_METHODS = {"pearson", "spearman"}
+DEFAULT_COEXPRESSION_TOP = 50
+MAX_COEXPRESSION_TOP = 1000
+
+def validate_coexpression_request(
+    organism: str,
+    data_type: str,
+    feature: str,
+    query_id: str,
+    top: str,
+    method: str,
+    columns: list[str] | None
+):
+    """
+    Validates the input for a co-expression search.
+    `top` is the raw number of results from the query string.
+    """
+    if not organism or not isinstance(organism, str):
+        raise ValidationError("Organism is required.")
+
+    if data_type not in ALLOWED_DATA_TYPES:
+        raise ValidationError(
+            f"Invalid data_type. Expected one of {ALLOWED_DATA_TYPES}."
+        )
+
+    if feature not in ALLOWED_FEATURES:
+        raise ValidationError(
+            f"Invalid feature. Expected one of {ALLOWED_FEATURES}."
+        )
+
+    if not query_id or not isinstance(query_id, str):
+        raise ValidationError("id is required.")
+
+    if not _is_count(top, MAX_COEXPRESSION_TOP):
+        raise ValidationError(
+            f"n must be an integer between 1 and {MAX_COEXPRESSION_TOP}."
+        )
+
+    if method not in COEXPRESSION_METHODS:
+        raise ValidationError(
+            f"Invalid method. Expected one of {COEXPRESSION_METHODS}."
+        )
+
+    if columns is not None:
+        if len(columns) < 3:
+            raise ValidationError(
+                "At least 3 columns are needed to correlate profiles."
+            )
+        if not all(isinstance(c, str) for c in columns):
+            raise ValidationError("All columns must be strings.")
+
+
+# --------------------
+# VALUE FILTER VALIDATION
+# --------------------
+FILTER_OPERATORS = {">", ">=", "<", "<=", "between", "abs>", "abs<"}
+FILTER_COMBINATORS = {"and", "or"}
+MAX_FILTER_PREDICATES = 50
+DEFAULT_FILTER_LIMIT = 100
+MAX_FILTER_LIMIT = 1000
+
+def validate_filter_request(
+    organism: str,
+    data_type: str,
+    feature: str,
+    filters: list[dict],
+    combine: str,
+    limit: int,
+    columns: list[str] | None
+):
+    """
+    Validates the input for a value filter query.
+    Each filter is {"column": str, "op": str, "value": number}, or
+    {"column": str, "op": "between", "value": [low, high]}.
+    """
+    if not organism or not isinstance(organism, str):
+        raise ValidationError("Organism is required.")
+
+    if data_type not in ALLOWED_DATA_TYPES:
+        raise ValidationError(
+            f"Invalid data_type. Expected one of {ALLOWED_DATA_TYPES}."
+        )
+
+    if feature not in ALLOWED_FEATURES:
+        raise ValidationError(
+            f"Invalid feature. Expected one of {ALLOWED_FEATURES}."
+        )
+
+    if not filters or not isinstance(filters, list):
+        raise ValidationError("filters must be a non-empty list of objects.")
+
+    if len(filters) > MAX_FILTER_PREDICATES:
+        raise ValidationError(
+            f"Maximum allowed filters per request is {MAX_FILTER_PREDICATES}."
+        )
+
+    for predicate in filters:
+        if not isinstance(predicate, dict):
+            raise ValidationError("Each filter must be an object.")
+
+        if not predicate.get("column") or not isinstance(
+            predicate.get("column"), str
+        ):
+            raise ValidationError("Each filter needs a column name.")
+
+        op = predicate.get("op")
+        if op not in FILTER_OPERATORS:
+            raise ValidationError(
+                f"Invalid filter op. Expected one of {FILTER_OPERATORS}."
+            )
+
+        value = predicate.get("value")
+        if op == "between":
+            if (
+                not isinstance(value, list)
+                or len(value) != 2
+                or not all(_is_number(v) for v in value)
+                or value[0] > value[1]
+            ):
+                raise ValidationError(
+                    "between expects a [low, high] pair of numbers."
+                )
+        elif not _is_number(value):
+            raise ValidationError(f"{op} expects a numeric value.")
+
+    if combine not in FILTER_COMBINATORS:
+        raise ValidationError(
+            f"Invalid combine. Expected one of {FILTER_COMBINATORS}."
+        )
+
+    if not _is_integer(limit) or not 1 <= limit <= MAX_FILTER_LIMIT:
+        raise ValidationError(
+            f"limit must be an integer between 1 and {MAX_FILTER_LIMIT}."
+        )
+
+    if columns is not None:
+        if not columns or not isinstance(columns, list):
+            raise ValidationError(
+                "columns must be a non-empty list of strings."
+            )
+        if not all(isinstance(c, str) for c in columns):
+            raise ValidationError("All columns must be strings.")
+
+
+def _is_number(value) -> bool:
+    # JSON numbers only (bool is an int subclass); NaN / inf and integers
+    # too large for a float never match
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return False
+    try:
+        return math.isfinite(value)
+    except OverflowError:
+        return False
+
+
+def _is_integer(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+# --------------------
+# SUMMARY STATISTICS VALIDATION
+# --------------------
+STATS_AXES = {"conditions", "rows"}
+
+def validate_stats_request(
+    organism: str,
+    data_type: str,
+    feature: str,
+    axis: str,
+    ids: list[str],
+    columns: list[str] | None
+):
+    """
+    Validates the input for a summary statistics request.
+    Statistics per condition may be restricted to `columns`; statistics
+    per row need `ids` (up to MAX_IDS).
+    """
+    if not organism or not isinstance(organism, str):
+        raise ValidationError("Organism is required.")
+
+    if data_type not in ALLOWED_DATA_TYPES:
+        raise ValidationError(
+            f"Invalid data_type. Expected one of {ALLOWED_DATA_TYPES}."
+        )
+
+    if feature not in ALLOWED_FEATURES:
+        raise ValidationError(
+            f"Invalid feature. Expected one of {ALLOWED_FEATURES}."
+        )
+
+    if axis not in STATS_AXES:
+        raise ValidationError(
+            f"Invalid axis. Expected one of {STATS_AXES}."
+        )
+
+    if axis == "rows":
+        if not ids:
+            raise ValidationError("ids are required for row statistics.")
+        if len(ids) > MAX_IDS:
+            raise IdsLimitExceededError(
+                f"Maximum allowed IDs per request is {MAX_IDS}."
+            )
+    elif ids:
+        raise ValidationError("ids only apply to row statistics.")
+
+    if columns is not None and axis == "rows":
+        raise ValidationError("columns only apply to condition statistics.")
+
+
+# --------------------
+# ID AUTOCOMPLETE VALIDATION
+# --------------------
+DEFAULT_AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 100
+MAX_AUTOCOMPLETE_PREFIX = 100
+
+def validate_autocomplete_request(
+    organism: str,
+    data_type: str,
+    feature: str,
+    prefix: str,
+    limit: str
+):
+    """
+    Validates the input for an ID autocomplete lookup.
+    `limit` is the raw number of IDs from the query string.
+    """
+    if not organism or not isinstance(organism, str):
+        raise ValidationError("Organism is required.")
+
+    if data_type not in ALLOWED_DATA_TYPES:
+        raise ValidationError(
+            f"Invalid data_type. Expected one of {ALLOWED_DATA_TYPES}."
+        )
+
+    if feature not in ALLOWED_FEATURES:
+        raise ValidationError(
+            f"Invalid feature. Expected one of {ALLOWED_FEATURES}."
+        )
+
+    if not prefix or not isinstance(prefix, str):
+        raise ValidationError("q is required.")
+
+    if len(prefix) > MAX_AUTOCOMPLETE_PREFIX:
+        raise ValidationError(
+            f"q must be at most {MAX_AUTOCOMPLETE_PREFIX} characters."
+        )
+
+    if not _is_count(limit, MAX_AUTOCOMPLETE_LIMIT):
+        raise ValidationError(
+            f"limit must be an integer between 1 and {MAX_AUTOCOMPLETE_LIMIT}."
+        )
+
+
+# --------------------
+# MULTI-DATASET QUERY VALIDATION
+# --------------------
+MAX_BATCH_TARGETS = 8
+
+def validate_batch_query_request(
+    targets: list[dict],
+    ids: list[str],
+    columns: list[str] | None,
+    meta: dict | None
+):
+    """
+    Validates the input for a query over several datasets.
+    Every target needs columns: its own "columns", the shared `columns`,
+    or the shared `meta` filters.
+    """
+    if not targets or not isinstance(targets, list):
+        raise ValidationError("targets must be a non-empty list of objects.")
+
+    if len(targets) > MAX_BATCH_TARGETS:
+        raise ValidationError(
+            f"Maximum allowed targets per request is {MAX_BATCH_TARGETS}."
+        )
+
+    if not ids or not isinstance(ids, list):
+        raise ValidationError("ids must be a non-empty list of strings.")
+
+    if not all(isinstance(g, str) for g in ids):
+        raise ValidationError("All ids must be strings.")
+
+    if len(ids) > MAX_IDS:
+        raise IdsLimitExceededError(
+            f"Maximum allowed IDs per request is {MAX_IDS}."
+        )
+
+    if meta is not None:
+        if columns:
+            raise ValidationError("Provide either columns or meta, not both.")
+        validate_meta_filters(meta)
+    elif columns is not None and (
+        not isinstance(columns, list)
+        or not all(isinstance(c, str) for c in columns)
+    ):
+        raise ValidationError("columns must be a list of strings.")
+
+    for target in targets:
+        if not isinstance(target, dict):
+            raise ValidationError("Each target must be an object.")
+
+        if not target.get("organism") or not isinstance(
+            target.get("organism"), str
+        ):
+            raise ValidationError("Each target needs an organism.")
+
+        if target.get("data_type") not in ALLOWED_DATA_TYPES:
+            raise ValidationError(
+                f"Invalid data_type. Expected one of {ALLOWED_DATA_TYPES}."
+            )
+
+        if target.get("feature") not in ALLOWED_FEATURES:
+            raise ValidationError(
+                f"Invalid feature. Expected one of {ALLOWED_FEATURES}."
+            )
+
+        target_columns = target.get("columns")
+        if target_columns is not None and (
+            not target_columns
+            or not isinstance(target_columns, list)
+            or not all(isinstance(c, str) for c in target_columns)
+        ):
+            raise ValidationError(
+                "Target columns must be a non-empty list of strings."
+            )
+
+        if not target_columns and not columns and meta is None:
+            raise ValidationError(
+                "Each target needs columns (its own, shared columns or meta)."
+            )